@@ -0,0 +1 @@
+"""Benchmarks for the 17TRACK integration, run against a local fake API."""
@@ -0,0 +1,178 @@
+"""Measure the cost of a coordinator refresh cycle at different package counts.
+
+Drives the real `Track17Api` and `Track17Coordinator` against the local
+fake API in `benchmarks.fake_17track` and prints one JSON document with
+wall time, requests issued, peak memory and event-loop blocking per cycle.
+
+    python -m benchmarks.bench_refresh --sizes 10 100 1000 5000 --output bench.json
+
+Each size runs a "cold" cycle (every package due) followed by a "warm"
+cycle (only packages the scheduler considers due).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.track17.api import Track17Api
+from custom_components.track17.const import API_RATE_BURST, API_RATE_LIMIT, VERSION
+from custom_components.track17.coordinator import Track17Coordinator
+from custom_components.track17.ratelimit import TokenBucket
+
+from .fake_17track import Fake17Track, FakeConfig
+
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+
+
+class LoopMonitor:
+    """Measure how long the event loop is blocked while a cycle runs.
+
+    A ticker sleeps for ``interval`` seconds; any extra delay before it
+    wakes up is time the loop spent running something else without
+    yielding.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - start - self.interval
+            if lag > 0:
+                self.max_lag = max(self.max_lag, lag)
+                self.total_lag += lag
+
+    def __enter__(self) -> "LoopMonitor":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._task:
+            self._task.cancel()
+
+
+async def measure(fake: Fake17Track, func: Callable[[], Awaitable[Any]]) -> Dict[str, Any]:
+    """Run ``func`` once and return its cost."""
+    fake.reset_stats()
+    tracemalloc.start()
+    with LoopMonitor() as monitor:
+        start = time.perf_counter()
+        await func()
+        wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_s": round(wall, 4),
+        "requests": fake.stats.requests,
+        "requests_by_endpoint": dict(fake.stats.by_endpoint),
+        "numbers_requested": fake.stats.numbers,
+        "errors_injected": fake.stats.errors,
+        "rate_limited": fake.stats.rate_limited,
+        "peak_mem_kb": round(peak / 1024, 1),
+        "loop_block_max_ms": round(monitor.max_lag * 1000, 2),
+        "loop_block_total_ms": round(monitor.total_lag * 1000, 2),
+    }
+
+
+async def bench_size(
+    hass: HomeAssistant, fake: Fake17Track, size: int, rps: float
+) -> List[Dict[str, Any]]:
+    """Benchmark cold and warm refresh cycles for ``size`` packages."""
+    entry = SimpleNamespace(data={"api_key": "bench"}, options={}, entry_id=f"bench_{size}")
+    coordinator = Track17Coordinator(hass, entry)
+    coordinator.api = Track17Api("bench", base_url=fake.base_url)
+    coordinator.api.rate_limiter = TokenBucket(rps, max(API_RATE_BURST, rps))
+    coordinator.tracking_numbers = [f"BENCH{size:05d}{i:06d}" for i in range(size)]
+    # Packages restored from storage are already registered with 17TRACK
+    coordinator._registered = set(coordinator.tracking_numbers)
+    coordinator.data = {}
+
+    async def cycle() -> None:
+        coordinator.data = await coordinator._async_update_data()
+
+    results = []
+    try:
+        for name in ("cold", "warm"):
+            result = await measure(fake, cycle)
+            results.append({"packages": size, "cycle": name, **result})
+    finally:
+        await coordinator.api.async_close()
+    return results
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    config = FakeConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        quota_total=args.quota,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results: List[Dict[str, Any]] = []
+        try:
+            async with Fake17Track(config) as fake:
+                for size in args.sizes:
+                    results.extend(await bench_size(hass, fake, size, args.rps))
+        finally:
+            await hass.async_stop(force=True)
+
+    return {
+        "meta": {
+            "integration_version": VERSION,
+            "python": platform.python_version(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "fake": vars(config),
+            "rps": args.rps,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 replies")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of 429 replies")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--rps", type=float, default=API_RATE_LIMIT, help="client rate limit")
+    parser.add_argument("--quota", type=int, default=FakeConfig.quota_total, help="account quota")
+    parser.add_argument("--seed", type=int, default=17)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.ERROR)
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
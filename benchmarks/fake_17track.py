@@ -0,0 +1,155 @@
+"""In-process aiohttp stand-in for the 17TRACK v2.4 API.
+
+Serves ``register``, ``gettrackinfo`` and ``getquota`` under ``/track/v2.4/`` with
+configurable latency, error rate and 429 injection, and counts every
+request so benchmarks can report how many calls a refresh cycle cost.
+"""
+import asyncio
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+API_PATH = "/track/v2.4/"
+STATUSES = ["InTransit", "InTransit", "InTransit", "OutForDelivery", "Delivered", "NotFound"]
+
+
+@dataclass
+class FakeConfig:
+    """Behaviour of the fake server."""
+
+    latency: float = 0.05
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    # Large enough that the quota budget does not limit a benchmark cycle
+    quota_total: int = 1_000_000_000
+    seed: Optional[int] = 17
+
+
+@dataclass
+class FakeStats:
+    """Counters collected by the fake server."""
+
+    requests: int = 0
+    numbers: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+
+def sample_item(number: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Return a realistic ``accepted`` item for ``number``.
+
+    The status and event age are derived from the number so repeated
+    fetches return identical payloads.
+    """
+    now = now or datetime.now(timezone.utc)
+    index = sum(map(ord, number))
+    status = STATUSES[index % len(STATUSES)]
+    event_time = (now - timedelta(hours=index % 200)).replace(minute=0, second=0, microsecond=0)
+    return {
+        "number": number,
+        "carrier": 3011,
+        "param": None,
+        "tag": None,
+        "track_info": {
+            "latest_status": {"status": status, "sub_status": f"{status}_Other"},
+            "latest_event": {
+                "time_iso": event_time.isoformat(),
+                "description": f"{status} event for {number}",
+                "location": "Sample City",
+            },
+            "shipping_info": {
+                "shipper_address": {"country": "CN"},
+                "recipient_address": {"country": "US"},
+            },
+            "tracking": {
+                "providers": [
+                    {
+                        "provider": {"name": "Sample Post"},
+                        "events": [
+                            {
+                                "time_iso": event_time.isoformat(),
+                                "description": f"{status} event for {number}",
+                                "location": "Sample City",
+                                "stage": status,
+                            }
+                        ],
+                    }
+                ]
+            },
+        },
+    }
+
+
+class Fake17Track:
+    """Run the fake API on localhost for the lifetime of an ``async with``."""
+
+    def __init__(self, config: Optional[FakeConfig] = None):
+        self.config = config or FakeConfig()
+        self.stats = FakeStats()
+        self._random = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.quota = {
+            "quota_total": self.config.quota_total,
+            "quota_used": 0,
+            "quota_remain": self.config.quota_total,
+        }
+        self.base_url = ""
+
+    async def __aenter__(self) -> "Fake17Track":
+        app = web.Application()
+        app.router.add_post(API_PATH + "{endpoint}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}{API_PATH}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    def reset_stats(self) -> None:
+        self.stats = FakeStats()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        endpoint = request.match_info["endpoint"]
+        self.stats.requests += 1
+        self.stats.by_endpoint[endpoint] = self.stats.by_endpoint.get(endpoint, 0) + 1
+
+        config = self.config
+        delay = config.latency + self._random.uniform(0, config.latency_jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < config.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return web.Response(status=429, headers={"Retry-After": str(config.retry_after)})
+        if roll < config.rate_limit_rate + config.error_rate:
+            self.stats.errors += 1
+            return web.Response(status=503)
+
+        if endpoint == "getquota":
+            return web.json_response({"code": 0, "data": self.quota})
+
+        payload = await request.json()
+        numbers: List[str] = [item["number"] for item in payload]
+        self.stats.numbers += len(numbers)
+        self.quota["quota_used"] += len(numbers)
+        self.quota["quota_remain"] = max(self.quota["quota_total"] - self.quota["quota_used"], 0)
+
+        if endpoint == "register":
+            accepted = [{"number": n, "carrier": 3011} for n in numbers]
+        elif endpoint == "gettrackinfo":
+            accepted = [sample_item(n) for n in numbers]
+        else:
+            return web.json_response({"code": 0, "data": {}})
+        return web.json_response({"code": 0, "data": {"accepted": accepted, "rejected": []}})
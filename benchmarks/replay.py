@@ -0,0 +1,124 @@
+"""Record real 17TRACK traffic and replay it to profile refresh cycles.
+
+Record one refresh cycle of real packages (the API key is not stored):
+
+    python -m benchmarks.replay record --api-key KEY --numbers RR123456785GB ... --output traffic.jsonl.gz
+
+Replay it with the recorded latencies, ten times faster, scaled out to
+5000 packages, and profile the cycle:
+
+    python -m benchmarks.replay profile traffic.jsonl.gz --speed 10 --packages 5000 --profile refresh.prof
+
+Without ``--profile`` the top functions by cumulative time are printed.
+"""
+import argparse
+import asyncio
+import cProfile
+import logging
+import pstats
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.track17.api import Track17Api
+from custom_components.track17.const import API_URL
+from custom_components.track17.coordinator import Track17Coordinator
+from custom_components.track17.transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+
+def make_coordinator(hass: HomeAssistant, api: Track17Api, numbers: List[str]) -> Track17Coordinator:
+    """Return a coordinator tracking ``numbers`` through ``api``."""
+    entry = SimpleNamespace(data={"api_key": api.api_key}, options={}, entry_id="replay")
+    coordinator = Track17Coordinator(hass, entry)
+    coordinator.api = api
+    coordinator.tracking_numbers = list(numbers)
+    coordinator.data = {}
+    return coordinator
+
+
+async def profile_cycle(coordinator: Track17Coordinator) -> pstats.Stats:
+    """Run one refresh cycle of ``coordinator`` under cProfile."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        coordinator.data = await coordinator._async_update_data()
+    finally:
+        profiler.disable()
+    return pstats.Stats(profiler)
+
+
+async def record(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api = Track17Api(args.api_key, base_url=args.base_url)
+        api.transport = RecordingTransport(AiohttpTransport(api._get_session), args.output)
+        try:
+            coordinator = make_coordinator(hass, api, args.numbers)
+            coordinator.data = await coordinator._async_update_data()
+        finally:
+            await api.async_close()
+            await hass.async_stop(force=True)
+    print(f"Recorded {len(api.transport.exchanges)} requests to {args.output}")
+
+
+async def profile(args: argparse.Namespace) -> None:
+    transport = ReplayTransport.from_file(args.recording, speed=args.speed)
+    count = args.packages or len(transport.recorded_numbers)
+    numbers = transport.numbers(count)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api = Track17Api("replay", transport=transport)
+        try:
+            coordinator = make_coordinator(hass, api, numbers)
+            # Packages restored from storage are already registered with 17TRACK
+            coordinator._registered = set(numbers)
+            start = time.perf_counter()
+            stats = await profile_cycle(coordinator)
+            wall = time.perf_counter() - start
+        finally:
+            await api.async_close()
+            await hass.async_stop(force=True)
+
+    print(f"Replayed a refresh of {count} packages in {wall:.3f}s at speed {args.speed}")
+    if args.profile:
+        stats.dump_stats(args.profile)
+        print(f"Profile written to {args.profile}")
+    else:
+        stats.sort_stats("cumulative").print_stats(args.top)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="record a refresh cycle against the real API")
+    rec.add_argument("--api-key", required=True)
+    rec.add_argument("--numbers", nargs="+", required=True)
+    rec.add_argument("--output", required=True, help="recording file (.jsonl.gz)")
+    rec.add_argument("--base-url", default=API_URL)
+
+    prof = commands.add_parser("profile", help="profile a refresh cycle replayed from a recording")
+    prof.add_argument("recording")
+    prof.add_argument("--speed", type=float, default=1.0, help="replay speed-up factor")
+    prof.add_argument("--packages", type=int, help="package count, synthetic beyond the recorded ones")
+    prof.add_argument("--profile", help="write pstats data here instead of printing")
+    prof.add_argument("--top", type=int, default=25, help="functions to print")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.ERROR)
+    asyncio.run(record(args) if args.command == "record" else profile(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,58 @@
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers import entity_registry as er
 from homeassistant.components import input_text as it
 from .const import DOMAIN
 from .coordinator import Track17Coordinator
+from .hub import Track17Hub, async_get_hub
+from .webhook import async_register_push
 
 PLATFORMS = ["sensor", "button"]
 
 DEFAULT_HELPER_ENTITY = "input_text.track17_new_package"
 
+SERVICES = (
+    "add_package",
+    "remove_package",
+    "add_packages",
+    "remove_packages",
+    "refresh_package",
+    "refresh_all_packages",
+    "add_package_from_helper",
+    "remove_package_from_helper",
+)
+
+CONF_ENTRY_ID = "config_entry_id"
+
+BULK_SCHEMA = vol.Schema(
+    {
+        vol.Required("tracking_numbers"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_ENTRY_ID): cv.string,
+    }
+)
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Create coordinator and register it early so other components can access
-    # it during the first refresh.
-    coordinator = Track17Coordinator(hass, entry)
+    # it during the first refresh. The hub shares the API client between
+    # entries using the same key.
+    hub = async_get_hub(hass)
+    coordinator = Track17Coordinator(hass, entry, hub)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    hub.add_coordinator(entry.entry_id, coordinator)
 
-    # Load stored package list before the first refresh so sensors are
-    # created for existing tracked numbers, then perform the first fetch.
+    # Load the stored package list and cached payloads so sensors are
+    # created immediately from the cache. The first network refresh runs in
+    # the background and only fetches entries older than CACHE_TTL.
     await coordinator.async_load()
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), "track17_first_refresh"
+    )
 
     # Automatically create input_text helper if it doesn't exist
     # hass.states is a StateMachine object; use `get` to check presence.
@@ -35,26 +67,146 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             },
         )
 
-    # Service handlers
+    if not hass.services.has_service(DOMAIN, "add_package"):
+        _async_register_services(hass, hub)
+
+    # Push mode: 17TRACK posts updates to a webhook, polling is a safety net
+    if coordinator.push_mode:
+        entry.async_on_unload(async_register_push(hass, entry, coordinator))
+
+    # Options are read when the coordinator is created; reload to apply changes
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    # Forward platforms
+    await _async_migrate_unique_ids(hass, entry)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_migrate_unique_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Add the entry id to unique ids created before several entries existed.
+
+    Entity ids are kept, so existing dashboards and history still apply.
+    """
+    prefix = f"{DOMAIN}_{entry.entry_id}_"
+
+    @callback
+    def _migrate(entity_entry: er.RegistryEntry):
+        if entity_entry.unique_id.startswith(prefix):
+            return None
+        suffix = entity_entry.unique_id.removeprefix(f"{DOMAIN}_")
+        return {"new_unique_id": f"{prefix}{suffix}"}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _migrate)
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry and clean up resources."""
+    coordinator: Track17Coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if not coordinator:
+        return True
+
+    # Unload platforms
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    # Write changes still waiting in the coalescing window
+    await coordinator.async_flush()
+
+    # Close api session (a no-op for the client shared through the hub)
+    try:
+        await coordinator.api.async_close()
+    except Exception:
+        pass
+
+    # Remove saved coordinator reference; the services stay registered
+    # while any other entry still uses them.
+    hass.data[DOMAIN].pop(entry.entry_id, None)
+    hub = async_get_hub(hass)
+    hub.remove_coordinator(entry.entry_id)
+    if not hub.coordinators:
+        for service in SERVICES:
+            hass.services.async_remove(DOMAIN, service)
+
+    return unload_ok
+
+
+def _async_register_services(hass: HomeAssistant, hub: Track17Hub) -> None:
+    """Register the domain services once, routing each call to its entry.
+
+    Calls naming a package go to the entries tracking it. Adding goes to
+    the entry given as ``config_entry_id``, or to the first loaded entry.
+    """
+
+    def _target(call):
+        coordinator = hub.get_coordinator(call.data.get(CONF_ENTRY_ID))
+        if coordinator is None:
+            raise ServiceValidationError(
+                f"Unknown 17TRACK config entry: {call.data.get(CONF_ENTRY_ID)}"
+            )
+        return coordinator
+
+    def _owners(number):
+        # Archived numbers are no longer tracked; fall back to the entries
+        # holding them in their archive.
+        return hub.coordinators_for(number) or [
+            c for c in hub.coordinators.values() if number in c.archive
+        ]
+
+    async def _async_remove(call, numbers):
+        """Remove ``numbers`` from the entries owning them."""
+        if CONF_ENTRY_ID in call.data:
+            return await _target(call).async_remove_packages(numbers)
+        results = {}
+        groups = {}
+        for number in numbers:
+            owners = _owners(number)
+            if not owners:
+                results[number] = {"success": False, "error": "Not tracked"}
+            for coordinator in owners:
+                groups.setdefault(coordinator.entry.entry_id, (coordinator, []))[1].append(number)
+        for coordinator, owned in groups.values():
+            for number, result in (await coordinator.async_remove_packages(owned)).items():
+                if result["success"] or number not in results:
+                    results[number] = result
+        return results
+
     async def handle_add_package(call):
         number = call.data["tracking_number"]
-        added = await coordinator.async_add_package(number)
-        if added:
-            await hass.config_entries.async_reload(entry.entry_id)
+        await _target(call).async_add_package(number)
 
     async def handle_remove_package(call):
         number = call.data["tracking_number"]
-        removed = await coordinator.async_remove_package(number)
-        if removed:
-            await hass.config_entries.async_reload(entry.entry_id)
+        await _async_remove(call, [number])
+
+    async def handle_add_packages(call: ServiceCall) -> ServiceResponse:
+        """Add a list of packages with batched API calls and one save."""
+        results = await _target(call).async_add_packages(call.data["tracking_numbers"])
+        return {"results": results}
+
+    async def handle_remove_packages(call: ServiceCall) -> ServiceResponse:
+        """Remove a list of packages with one save."""
+        results = await _async_remove(call, call.data["tracking_numbers"])
+        return {"results": results}
 
     async def handle_refresh_package(call):
         number = call.data["tracking_number"]
-        await coordinator.async_refresh_package(number)
+        # One fetch is enough: the hub shares the result with other owners
+        owners = hub.coordinators_for(number)
+        if owners:
+            await owners[0].async_refresh_package(number)
 
     async def handle_refresh_all(call):
-        """Refresh all tracked packages on demand."""
-        await coordinator.async_refresh_all_packages()
+        """Refresh all tracked packages of one entry, or of every entry."""
+        if CONF_ENTRY_ID in call.data:
+            await _target(call).async_refresh_all_packages()
+            return
+        for coordinator in list(hub.coordinators.values()):
+            await coordinator.async_refresh_all_packages()
 
     async def handle_add_from_helper(call):
         """Read the input_text helper and add that package.
@@ -67,9 +219,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         if not state:
             return
         number = state.state
-        added = await coordinator.async_add_package(number)
-        if added:
-            await hass.config_entries.async_reload(entry.entry_id)
+        await _target(call).async_add_package(number)
 
     async def handle_remove_from_helper(call):
         """Read the input_text helper and remove that package.
@@ -82,45 +232,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         if not state:
             return
         number = state.state
-        removed = await coordinator.async_remove_package(number)
-        if removed:
-            await hass.config_entries.async_reload(entry.entry_id)
+        await _async_remove(call, [number])
 
     # Register services
     hass.services.async_register(DOMAIN, "add_package", handle_add_package)
     hass.services.async_register(DOMAIN, "remove_package", handle_remove_package)
+    hass.services.async_register(
+        DOMAIN, "add_packages", handle_add_packages,
+        schema=BULK_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "remove_packages", handle_remove_packages,
+        schema=BULK_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(DOMAIN, "refresh_package", handle_refresh_package)
     hass.services.async_register(DOMAIN, "refresh_all_packages", handle_refresh_all)
     hass.services.async_register(DOMAIN, "add_package_from_helper", handle_add_from_helper)
     hass.services.async_register(DOMAIN, "remove_package_from_helper", handle_remove_from_helper)
 
-    # Forward platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
-
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry and clean up resources."""
-    coordinator: Track17Coordinator = hass.data[DOMAIN].get(entry.entry_id)
-    if not coordinator:
-        return True
-
-    # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    # Close api session
-    try:
-        await coordinator.api.async_close()
-    except Exception:
-        pass
-
-    # Remove saved coordinator reference and services
-    hass.data[DOMAIN].pop(entry.entry_id, None)
-    hass.services.async_remove(DOMAIN, "add_package")
-    hass.services.async_remove(DOMAIN, "remove_package")
-    hass.services.async_remove(DOMAIN, "refresh_package")
-    hass.services.async_remove(DOMAIN, "refresh_all_packages")
-    hass.services.async_remove(DOMAIN, "add_package_from_helper")
-    hass.services.async_remove(DOMAIN, "remove_package_from_helper")
-
-    return unload_ok
@@ -1,73 +1,391 @@
 import aiohttp
 import asyncio
-import json
 import logging
-from typing import Dict, Any, Optional
-from .const import API_URL, DEFAULT_HEADERS
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+
+from homeassistant.util.json import json_loads
+
+from .const import (
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_BATCH_SIZE,
+    API_CHUNK_TIMEOUT,
+    API_ERROR_ALREADY_REGISTERED,
+    API_FRESHNESS_WINDOW,
+    API_MAX_RETRIES,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_TIMEOUT,
+    API_URL,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CONCURRENCY_LATENCY_TARGET,
+    CONCURRENCY_START,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MIN_CONCURRENCY,
+    DEFAULT_HEADERS,
+)
+from .metrics import ApiMetrics
+from .models import PackageState
+from .quota import QuotaBudget
+from .ratelimit import AdaptiveConcurrency, CircuitBreaker, TokenBucket, backoff_delay
+from .transport import AiohttpTransport, Transport
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
 class Track17Api:
     """Small wrapper around 17TRACK HTTP API used by the coordinator.
 
-    The coordinator expects:
-    - async_get_tracking(number) -> dict (may contain an "error" key)
+    Package payloads are `PackageState` records; failures are plain dicts
+    with an "error" key. The coordinator expects:
+    - async_get_tracking(number) -> PackageState or error dict
+    - async_get_tracking_batch(numbers) -> { number: PackageState or dict }
+    - async_register_batch(numbers) -> { number: dict } (see its docstring)
+    - async_get_quota() -> dict (may contain an "error" key)
     - fetch_single(number) -> { number: dict }
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = API_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        transport: Optional[Transport] = None,
+    ):
         self.api_key = api_key
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.base_url = base_url
+        # A session passed in is shared (see `Track17Hub`) and never closed here
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        # How requests are sent; tests and benchmarks record or replay traffic
+        self.transport: Transport = transport or AiohttpTransport(self._get_session)
+        self._headers = DEFAULT_HEADERS.copy()
+        # If an API key is provided, send it as a Bearer token. Headers are
+        # sent per request so several keys can share one session.
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        self.rate_limiter = TokenBucket(API_RATE_LIMIT, API_RATE_BURST)
+        self.breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN)
+        # Requests in flight across all batches of this client
+        self.concurrency = AdaptiveConcurrency(
+            DEFAULT_MIN_CONCURRENCY,
+            DEFAULT_MAX_CONCURRENCY,
+            CONCURRENCY_START,
+            CONCURRENCY_LATENCY_TARGET,
+        )
+        self.metrics = ApiMetrics()
+        self.quota = QuotaBudget()
+        # Single flight for gettrackinfo: number -> future of the request in
+        # progress, and number -> (monotonic time, payload) of recent results
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._recent: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self.session is None or self.session.closed:
-            headers = DEFAULT_HEADERS.copy()
-            # If an API key is provided, send it as a Bearer token. This keeps
-            # headers configurable but ensures the coordinator-provided key is used.
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            self.session = aiohttp.ClientSession(headers=headers)
+        if self._owns_session and (self.session is None or self.session.closed):
+            self.session = aiohttp.ClientSession()
         return self.session
 
     async def async_get_tracking(self, tracking_number: str) -> Dict[str, Any]:
         """Fetch tracking info for a single package.
 
-        Returns a dict representing the API response. On error the dict
-        should contain an "error" key so the coordinator can detect failures.
+        Returns the package's `PackageState`. On error a dict with an
+        "error" key is returned so the coordinator can detect failures.
         """
-        url = f"{API_URL}trackings"
-        payload = {"tracking_number": tracking_number}
+        results = await self.async_get_tracking_batch([tracking_number])
+        return results.get(tracking_number, {"error": "Missing from response"})
+
+    async def async_get_tracking_batch(
+        self, tracking_numbers: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch tracking info for many packages in as few requests as possible.
 
-        session = await self._get_session()
+        Numbers are split into chunks of ``API_BATCH_SIZE`` (the v2.4 limit)
+        and chunks are requested concurrently, as many at once as
+        `AdaptiveConcurrency` allows. Every
+        requested number is present in the returned mapping; failed numbers
+        map to a dict with an "error" key, exactly like `async_get_tracking`.
+        """
+        return await self._async_batch("gettrackinfo", tracking_numbers)
+
+    async def async_register_batch(
+        self,
+        tracking_numbers: List[str],
+        carriers: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Register numbers with 17TRACK in chunks of ``API_BATCH_SIZE``.
+
+        ``carriers`` optionally maps numbers to a 17TRACK carrier code sent
+        as a hint, sparing 17TRACK its own carrier detection. Newly
+        registered numbers map to the `PackageState` of their ``accepted`` item
+        (carrier known, no tracking events yet), numbers registered earlier
+        map to ``{"already_registered": True}`` and rejected ones to a dict
+        with an "error" key.
+        """
+        return await self._async_batch("register", tracking_numbers, carriers)
+
+    async def async_get_quota(self) -> Dict[str, Any]:
+        """Return the account quota (``quota_total``, ``quota_used``,
+        ``quota_remain``, ...) or a dict with an "error" key.
+        """
+        data = await self._async_post("getquota", {})
+        if "error" in data:
+            return data
+        quota = data.get("data")
+        if not isinstance(quota, dict):
+            return {"error": "Unexpected data format"}
+        self.quota.update(quota)
+        return quota
+
+    async def _async_batch(
+        self,
+        endpoint: str,
+        tracking_numbers: List[str],
+        carriers: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run ``endpoint`` over de-duplicated numbers in concurrent chunks."""
+        results: Dict[str, Dict[str, Any]] = {}
+        async for chunk_results in self.async_iter_batches(
+            endpoint, tracking_numbers, carriers=carriers
+        ):
+            results.update(chunk_results)
+        return results
+
+    async def async_iter_batches(
+        self,
+        endpoint: str,
+        tracking_numbers: List[str],
+        chunk_timeout: float = API_CHUNK_TIMEOUT,
+        carriers: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[Dict[str, Dict[str, Any]]]:
+        """Yield per-chunk results of ``endpoint`` as each chunk completes.
+
+        A chunk that takes longer than ``chunk_timeout`` seconds (including
+        its retries) is abandoned and its numbers are yielded with an
+        "error" key, so one hung request cannot hold the caller open.
+
+        For ``gettrackinfo`` concurrent callers share requests: numbers
+        fetched within `API_FRESHNESS_WINDOW` are yielded from memory first,
+        numbers already being fetched by another caller are awaited and
+        yielded last, and only the rest are requested.
+        """
+        numbers = list(dict.fromkeys(n for n in tracking_numbers if n))
+        fresh: Dict[str, Dict[str, Any]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        if endpoint == "gettrackinfo":
+            numbers, fresh, waiting, owned = self._claim(numbers)
+        chunks = [numbers[i:i + API_BATCH_SIZE] for i in range(0, len(numbers), API_BATCH_SIZE)]
+
+        async def _fetch(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            await self.concurrency.acquire()
+            try:
+                return await asyncio.wait_for(self._async_fetch_chunk(endpoint, chunk, carriers), chunk_timeout)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("17TRACK %s chunk of %d numbers timed out", endpoint, len(chunk))
+                return {number: {"error": "API request timed out"} for number in chunk}
+            finally:
+                await self.concurrency.release()
+
+        tasks = [asyncio.ensure_future(_fetch(c)) for c in chunks]
         try:
-            # Use a ClientTimeout for compatibility and clarity
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with session.post(url, json=payload, timeout=timeout) as resp:
-                text = await resp.text()
-                # Try to parse JSON; if parsing fails return an error dict
-                try:
-                    data = json.loads(text)
-                except json.JSONDecodeError:
-                    _LOGGER.error("Invalid JSON from 17TRACK for %s: %s", tracking_number, text[:200])
-                    return {"error": f"Invalid JSON response"}
-
-                if not isinstance(data, dict):
-                    _LOGGER.error("Unexpected data type from 17TRACK for %s: %s", tracking_number, type(data))
-                    return {"error": "Unexpected data format"}
-
-                # If the upstream API encloses an error field, propagate it
-                if "error" in data:
-                    return {"error": data.get("error")}
-
-                return data
+            if fresh:
+                yield fresh
+            for task in asyncio.as_completed(tasks):
+                results = await task
+                self._settle(owned, results)
+                yield results
+            if waiting:
+                shared = await asyncio.gather(*(asyncio.shield(f) for f in waiting.values()))
+                yield dict(zip(waiting, shared))
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Never leave other callers waiting on an abandoned request
+            self._settle(owned, {n: {"error": "Request cancelled"} for n in owned})
 
+    def _claim(self, numbers: List[str]) -> Tuple[
+        List[str],
+        Dict[str, Dict[str, Any]],
+        Dict[str, asyncio.Future],
+        Dict[str, asyncio.Future],
+    ]:
+        """Split ``numbers`` into to-fetch, fresh, in-flight and claimed.
+
+        Claimed numbers get a future other callers can wait on until
+        `_settle` resolves it.
+        """
+        now = time.monotonic()
+        self._recent = {
+            n: entry for n, entry in self._recent.items() if now - entry[0] < API_FRESHNESS_WINDOW
+        }
+        loop = asyncio.get_running_loop()
+        to_fetch: List[str] = []
+        fresh: Dict[str, Dict[str, Any]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        for number in numbers:
+            if number in self._recent:
+                fresh[number] = self._recent[number][1]
+            elif number in self._inflight:
+                waiting[number] = self._inflight[number]
+            else:
+                owned[number] = self._inflight[number] = loop.create_future()
+                to_fetch.append(number)
+        return to_fetch, fresh, waiting, owned
+
+    def _settle(self, owned: Dict[str, asyncio.Future], results: Dict[str, Dict[str, Any]]) -> None:
+        """Resolve claimed futures with ``results`` and remember successes."""
+        now = time.monotonic()
+        for number, data in results.items():
+            future = owned.get(number)
+            if future is None or future.done():
+                continue
+            future.set_result(data)
+            if self._inflight.get(number) is future:
+                del self._inflight[number]
+            if "error" not in data:
+                self._recent[number] = (now, data)
+
+    async def _async_fetch_chunk(
+        self, endpoint: str, chunk: List[str], carriers: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """POST one chunk to ``endpoint`` and map the reply per number."""
+        carriers = carriers or {}
+        payload = [
+            {"number": n, "carrier": carriers[n]} if carriers.get(n) else {"number": n}
+            for n in chunk
+        ]
+        data = await self._async_post(endpoint, payload)
+        if "error" in data:
+            # The whole request failed; every number in the chunk shares it.
+            return {number: {"error": data["error"]} for number in chunk}
+
+        body = data.get("data") or {}
+        self.quota.record_usage(len(body.get("accepted") or []))
+        results: Dict[str, Dict[str, Any]] = {}
+        for item in body.get("accepted") or []:
+            if isinstance(item, dict) and item.get("number") in chunk:
+                results[item["number"]] = PackageState.from_item(item)
+        for item in body.get("rejected") or []:
+            if isinstance(item, dict) and item.get("number") in chunk:
+                error = item.get("error") or {}
+                if endpoint == "register" and error.get("code") == API_ERROR_ALREADY_REGISTERED:
+                    results[item["number"]] = {"already_registered": True}
+                    continue
+                results[item["number"]] = {"error": error.get("message") or "Rejected by 17TRACK"}
+                if error.get("code") is not None:
+                    results[item["number"]]["code"] = error["code"]
+        for number in chunk:
+            results.setdefault(number, {"error": "Missing from response"})
+        return results
+
+    async def _async_post(self, endpoint: str, payload: Any) -> Dict[str, Any]:
+        """POST ``payload`` to an API endpoint and return the decoded body.
+
+        Every attempt waits for the shared rate limiter. Timeouts,
+        connection errors, 429 and 5xx responses are retried with
+        exponential backoff and jitter; a 429 ``Retry-After`` pauses all
+        requests. While the circuit breaker is open no request is sent.
+        On failure the returned dict contains an "error" key instead.
+        """
+        if not self.breaker.allow():
+            self.metrics.record_skipped("Circuit breaker open")
+            return {"error": "Circuit breaker open"}
+
+        for attempt in range(API_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            start = time.monotonic()
+            data, retryable, retry_after = await self._async_post_once(endpoint, payload)
+            latency = time.monotonic() - start
+            self.metrics.record_request(latency, data.get("error"))
+            self.concurrency.record(start, latency, overloaded=retryable)
+            if not retryable or attempt == API_MAX_RETRIES:
+                break
+            delay = retry_after if retry_after is not None else backoff_delay(
+                attempt, API_BACKOFF_BASE, API_BACKOFF_MAX
+            )
+            _LOGGER.debug(
+                "Retrying 17TRACK %s in %.1fs after: %s", endpoint, delay, data.get("error")
+            )
+            await asyncio.sleep(delay)
+
+        if retryable:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return data
+
+    async def _async_post_once(
+        self, endpoint: str, payload: Any
+    ) -> Tuple[Dict[str, Any], bool, Optional[float]]:
+        """Send one request.
+
+        Returns ``(data, retryable, retry_after)`` where ``retryable`` tells
+        whether the failure is transient and ``retry_after`` is the delay
+        requested by a 429 response, if any.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            # Use a ClientTimeout for compatibility and clarity
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            resp = await self.transport.async_post(url, payload, self._headers, timeout)
         except asyncio.TimeoutError:
-            _LOGGER.warning("17TRACK request timed out for %s", tracking_number)
-            return {"error": "API request timed out"}
+            _LOGGER.warning("17TRACK %s request timed out", endpoint)
+            return {"error": "API request timed out"}, True, None
         except aiohttp.ClientError as e:
-            _LOGGER.exception("HTTP error while fetching %s: %s", tracking_number, e)
-            return {"error": f"HTTP error: {e}"}
+            _LOGGER.warning("HTTP error while calling 17TRACK %s: %s", endpoint, e)
+            return {"error": f"HTTP error: {e}"}, True, None
+
+        if resp.status == 429:
+            retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                self.rate_limiter.pause(retry_after)
+            _LOGGER.warning("17TRACK rate limit hit on %s", endpoint)
+            return {"error": "Rate limited"}, True, retry_after
+        if resp.status >= 500:
+            return {"error": f"HTTP {resp.status}"}, True, None
+
+        # Decode once, straight from the body bytes (orjson); if parsing
+        # fails return an error dict
+        try:
+            data = json_loads(resp.body)
+        except ValueError:
+            _LOGGER.error("Invalid JSON from 17TRACK %s: %r", endpoint, resp.body[:200])
+            return {"error": "Invalid JSON response"}, False, None
+
+        if not isinstance(data, dict):
+            _LOGGER.error("Unexpected data type from 17TRACK %s: %s", endpoint, type(data))
+            return {"error": "Unexpected data format"}, False, None
+
+        # If the upstream API encloses an error field, propagate it
+        if "error" in data:
+            return {"error": data.get("error")}, False, None
+        if data.get("code", 0) != 0:
+            return {"error": f"API error code {data.get('code')}"}, False, None
+
+        return data, False, None
 
     async def fetch_single(self, tracking_number: str) -> Dict[str, Any]:
         """Fetch a single package and return a mapping suitable for
@@ -79,7 +397,8 @@ class Track17Api:
         return {tracking_number: data}
 
     async def async_close(self) -> None:
-        """Close the aiohttp session if open."""
-        if self.session and not self.session.closed:
+        """Close the transport, and the aiohttp session if owned by this client."""
+        await self.transport.async_close()
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             self.session = None
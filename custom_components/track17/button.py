@@ -9,18 +9,14 @@ class Track17RefreshButton(CoordinatorEntity, ButtonEntity):
         """Initialize the button."""
         super().__init__(coordinator)
         self._attr_name = "17TRACK Refresh"
-        self._attr_unique_id = f"{DOMAIN}_refresh_button"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_refresh_button"
         self._attr_icon = "mdi:refresh"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        # Use the coordinator helper which triggers a refresh for all
-        # packages. Coordinator exposes async_refresh_all_packages.
-        if hasattr(self.coordinator, "async_refresh_all_packages"):
-            await self.coordinator.async_refresh_all_packages()
-        else:
-            # Fallback to requesting a refresh
-            await self.coordinator.async_request_refresh()
+        # Refresh every package with one batched fetch rather than going
+        # through the debounced scheduled refresh.
+        await self.coordinator.async_refresh_all_packages()
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -0,0 +1,117 @@
+import re
+from typing import Callable, Dict, NamedTuple, Optional, Pattern, Tuple
+
+# Characters 17TRACK accepts in a tracking number, and its length limits
+_NUMBER_RE = re.compile(r"^[A-Z0-9-]{5,50}$", re.IGNORECASE)
+
+# UPU S10 postal operators by country suffix: name and 17TRACK carrier code
+UPU_OPERATORS: Dict[str, Tuple[str, Optional[int]]] = {
+    "AU": ("Australia Post", 1151),
+    "CA": ("Canada Post", 3041),
+    "CN": ("China Post", 3011),
+    "DE": ("Deutsche Post", 7041),
+    "FR": ("La Poste", 6051),
+    "GB": ("Royal Mail", 11031),
+    "NL": ("PostNL", 14041),
+    "US": ("USPS", 21051),
+}
+
+
+def s10_check(number: str) -> bool:
+    """Validate the check digit of a UPU S10 number (``RR123456785GB``)."""
+    digits = number[2:10]
+    total = sum(int(d) * w for d, w in zip(digits, (8, 6, 4, 2, 3, 5, 9, 7)))
+    check = 11 - total % 11
+    check = {10: 0, 11: 5}.get(check, check)
+    return int(number[10]) == check
+
+
+def ups_check(number: str) -> bool:
+    """Validate the check digit of a UPS ``1Z`` number."""
+    body = number[2:-1]
+    total = 0
+    for position, char in enumerate(body, start=1):
+        value = int(char) if char.isdigit() else (ord(char) - ord("A") + 2) % 10
+        total += value * 2 if position % 2 == 0 else value
+    return int(number[-1]) == (10 - total % 10) % 10
+
+
+def mod10_check(number: str) -> bool:
+    """Validate a GS1-style mod 10 check digit (weights 3/1 from the right)."""
+    digits = [int(d) for d in number[:-1]]
+    total = sum(d * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(digits)))
+    return int(number[-1]) == (10 - total % 10) % 10
+
+
+class CarrierFormat(NamedTuple):
+    """One known tracking-number format.
+
+    ``strict`` formats are distinctive enough that a number matching the
+    pattern but failing ``check`` is certainly mistyped; for the others a
+    failed check only means the number belongs to some other carrier.
+    """
+
+    name: str
+    code: Optional[int]
+    pattern: Pattern[str]
+    lengths: Tuple[int, ...]
+    check: Optional[Callable[[str], bool]] = None
+    strict: bool = False
+
+
+class CarrierMatch(NamedTuple):
+    """A carrier detected from the shape of a tracking number."""
+
+    name: str
+    code: Optional[int]
+
+
+CARRIER_FORMATS: Tuple[CarrierFormat, ...] = (
+    # Carrier resolved from the country suffix, see `detect_carrier`
+    CarrierFormat("UPU S10", None, re.compile(r"^[A-Z]{2}\d{9}[A-Z]{2}$"), (13,), s10_check, True),
+    CarrierFormat("UPS", 100002, re.compile(r"^1Z[0-9A-Z]{16}$"), (18,), ups_check, True),
+    CarrierFormat("USPS", 21051, re.compile(r"^9[1-5]\d{20}$"), (22,), mod10_check),
+    CarrierFormat("Amazon Logistics", None, re.compile(r"^TBA\d{12}$"), (15,), strict=True),
+)
+
+# Formats grouped by length so a lookup only tries plausible patterns
+_INDEX: Dict[int, Tuple[CarrierFormat, ...]] = {}
+for _fmt in CARRIER_FORMATS:
+    for _length in _fmt.lengths:
+        _INDEX[_length] = _INDEX.get(_length, ()) + (_fmt,)
+
+
+def _match(fmt: CarrierFormat, number: str) -> CarrierMatch:
+    if fmt.name == "UPU S10":
+        name, code = UPU_OPERATORS.get(number[-2:], (f"Postal service ({number[-2:]})", None))
+        return CarrierMatch(name, code)
+    return CarrierMatch(fmt.name, fmt.code)
+
+
+def detect_carrier(number: str) -> Optional[CarrierMatch]:
+    """Return the carrier whose format ``number`` matches, if any."""
+    number = number.strip().upper()
+    for fmt in _INDEX.get(len(number), ()):
+        if fmt.pattern.match(number) and (fmt.check is None or fmt.check(number)):
+            return _match(fmt, number)
+    return None
+
+
+def validate_tracking_number(number: str) -> Optional[str]:
+    """Return why ``number`` cannot be a tracking number, or None.
+
+    Only certain mistakes are rejected: characters or lengths 17TRACK never
+    accepts, and check digits failing in a strict format. Numbers of unknown
+    formats pass, since 17TRACK supports far more carriers than this index.
+    """
+    number = number.strip().upper()
+    if not _NUMBER_RE.match(number):
+        return "Invalid tracking number format"
+    for fmt in _INDEX.get(len(number), ()):
+        if not fmt.pattern.match(number):
+            continue
+        if fmt.check is None or fmt.check(number):
+            return None
+        if fmt.strict:
+            return f"Invalid check digit for {_match(fmt, number).name}"
+    return None
@@ -1,6 +1,23 @@
 from homeassistant import config_entries
+from homeassistant.core import callback
 import voluptuous as vol
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL_HOURS
+from .const import (
+    DOMAIN,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MIN_CONCURRENCY,
+    DEFAULT_SCAN_INTERVAL_HOURS,
+)
+
+DEFAULT_OPTIONS = {
+    "scan_interval": DEFAULT_SCAN_INTERVAL_HOURS,
+    "push_mode": False,
+    "incremental_refresh": False,
+    "archive_after_days": DEFAULT_ARCHIVE_AFTER_DAYS,
+    "min_concurrency": DEFAULT_MIN_CONCURRENCY,
+    "max_concurrency": DEFAULT_MAX_CONCURRENCY,
+}
+
 
 class Track17ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -10,7 +27,7 @@ class Track17ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title="17TRACK",
                 data={"api_key": user_input["api_key"]},
-                options={"scan_interval": DEFAULT_SCAN_INTERVAL_HOURS},
+                options=dict(DEFAULT_OPTIONS),
             )
 
         return self.async_show_form(
@@ -20,16 +37,48 @@ class Track17ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }),
         )
 
-    async def async_step_options(self, user_input=None):
-        if user_input:
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return Track17OptionsFlow(config_entry)
+
+
+class Track17OptionsFlow(config_entries.OptionsFlow):
+    """Change the options of an entry; the entry reloads to apply them."""
+
+    def __init__(self, config_entry):
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = {**DEFAULT_OPTIONS, **self.config_entry.options}
         return self.async_show_form(
-            step_id="options",
+            step_id="init",
             data_schema=vol.Schema({
                 vol.Required(
                     "scan_interval",
-                    default=DEFAULT_SCAN_INTERVAL_HOURS
-                ): int
+                    default=options["scan_interval"]
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional("push_mode", default=options["push_mode"]): bool,
+                vol.Optional(
+                    "incremental_refresh",
+                    default=options["incremental_refresh"]
+                ): bool,
+                vol.Optional(
+                    "archive_after_days",
+                    default=options["archive_after_days"]
+                ): vol.All(int, vol.Range(min=0)),
+                # Bounds for the adaptive number of parallel API requests;
+                # a maximum below the minimum is raised to it.
+                vol.Optional(
+                    "min_concurrency",
+                    default=options["min_concurrency"]
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(
+                    "max_concurrency",
+                    default=options["max_concurrency"]
+                ): vol.All(int, vol.Range(min=1)),
             }),
         )
@@ -1,15 +1,117 @@
+from datetime import timedelta
+
 DOMAIN = "track17"
+# hass.data key of the domain-wide Track17Hub
+DATA_HUB = f"{DOMAIN}_hub"
 
+# Upper bound on the per-package poll interval (option "scan_interval")
 DEFAULT_SCAN_INTERVAL_HOURS = 24
 
+# How often the coordinator wakes up to poll the packages that are due
+SCHEDULER_TICK = timedelta(minutes=15)
+
+# Per-package poll interval is the age of the last event divided by this,
+# clamped between POLL_INTERVAL_MIN and the configured scan_interval.
+POLL_AGE_DIVISOR = 4
+POLL_INTERVAL_MIN = timedelta(minutes=30)
+# Used when a package has no event time yet (e.g. just registered)
+POLL_INTERVAL_UNKNOWN = timedelta(hours=6)
+# Retry delay after a per-package API error
+POLL_INTERVAL_ERROR = timedelta(hours=1)
+
+# In push mode packages still get a slow safety-net poll at most this often
+PUSH_SAFETY_INTERVAL = timedelta(hours=24)
+# 17TRACK push event carrying new tracking data
+PUSH_EVENT_UPDATED = "TRACKING_UPDATED"
+
+# Days a delivered/expired package stays tracked before it is archived
+DEFAULT_ARCHIVE_AFTER_DAYS = 7
+
+# Main package statuses of the 17TRACK v2.4 API, one summary sensor each
+PACKAGE_STATUSES = (
+    "NotFound",
+    "InfoReceived",
+    "InTransit",
+    "Expired",
+    "AvailableForPickup",
+    "OutForDelivery",
+    "DeliveryFailure",
+    "Delivered",
+    "Exception",
+)
+
+# Statuses most likely to change soon; polled first when the budget is tight
+HOT_STATUSES = ("OutForDelivery", "AvailableForPickup", "DeliveryFailure", "Exception")
+
+# Statuses after which a package is no longer polled
+FINAL_STATUSES = ("Delivered", "Expired")
+
 STORAGE_KEY = "track17_packages"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+STORAGE_MINOR_VERSION = 4
+
+# Cached payloads older than this are refetched by the first refresh
+CACHE_TTL = timedelta(hours=12)
+# Every change (adds, removes, fetched payloads) is written at most this
+# many seconds after the first change of a burst, in one save
+STORAGE_SAVE_DELAY = 10
 
 EVENT_DELIVERED = "track17_delivered"
+# Fired once for every new tracking event (checkpoint) of a package
+EVENT_CHECKPOINT = "track17_checkpoint"
+
+# Tracking events kept per package in the stored timeline
+TIMELINE_MAX_EVENTS = 100
 
 VERSION = "1.1.6"
 API_URL = "https://api.17track.net/track/v2.4/"
 
+# Maximum tracking numbers the v2.4 API accepts per request
+API_BATCH_SIZE = 40
+
+# Rolling window of request latencies kept for percentiles
+METRICS_LATENCY_SAMPLES = 500
+# How often the account quota is read from the API
+QUOTA_REFRESH_INTERVAL = timedelta(hours=1)
+
+# Quota budget: each UTC day gets an equal share of the remaining quota over
+# QUOTA_HORIZON, keeping QUOTA_RESERVE_FRACTION of the total for new packages
+QUOTA_BUDGET_PERIOD = timedelta(days=1)
+QUOTA_HORIZON = timedelta(days=30)
+QUOTA_RESERVE_FRACTION = 0.05
+
+# Rejection code returned by ``register`` for numbers already registered
+API_ERROR_ALREADY_REGISTERED = -18019901
+# Rejection code returned by ``gettrackinfo`` for numbers not registered
+API_ERROR_NOT_REGISTERED = -18019902
+
+# Request timeout in seconds
+API_TIMEOUT = 10
+# Upper bound in seconds on one chunk including retries, so a hung request
+# cannot hold a refresh cycle open
+API_CHUNK_TIMEOUT = 60
+# Incremental refresh publishes completed packages at most this often (s)
+STREAM_FLUSH_INTERVAL = 1.0
+# A package fetched this recently (s) is served from memory, not refetched
+API_FRESHNESS_WINDOW = 10.0
+# Token bucket shared by all requests: sustained requests/second and burst
+API_RATE_LIMIT = 3
+API_RATE_BURST = 3
+# Retries for timeouts, connection errors, 429 and 5xx responses
+API_MAX_RETRIES = 3
+API_BACKOFF_BASE = 1.0
+API_BACKOFF_MAX = 30.0
+# Adaptive (AIMD) number of concurrent requests: default option limits,
+# starting point, and the latency (s) above which it stops growing
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 8
+CONCURRENCY_START = 5
+CONCURRENCY_LATENCY_TARGET = 2.0
+# Consecutive failed requests that open the circuit breaker, and how long
+# (seconds) polling stays suspended before a trial request
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 900
+
 DEFAULT_HEADERS = {
     "Content-Type": "application/json",
     "User-Agent": "HomeAssistant-Track17-Integration/1.1.6"
@@ -1,157 +1,648 @@
-from datetime import timedelta
 import asyncio
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+import hashlib
 import json
-from typing import Any, Dict, List, Optional, Set, Tuple
+import time
+from typing import Any, Dict, List, Optional, Set
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.storage import Store
-from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from .api import Track17Api
-from .const import STORAGE_KEY, STORAGE_VERSION, EVENT_DELIVERED
+from .carriers import detect_carrier, validate_tracking_number
+from .const import (
+    API_ERROR_NOT_REGISTERED,
+    CACHE_TTL,
+    DEFAULT_SCAN_INTERVAL_HOURS,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    EVENT_CHECKPOINT,
+    EVENT_DELIVERED,
+    FINAL_STATUSES,
+    POLL_INTERVAL_MIN,
+    PUSH_SAFETY_INTERVAL,
+    QUOTA_REFRESH_INTERVAL,
+    STREAM_FLUSH_INTERVAL,
+    SCHEDULER_TICK,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .hub import configure_concurrency
+from .metrics import CycleMetrics
+from .models import PackageState
+from .scheduler import PackageScheduler
+from .storage import Track17Store
+from .summary import PackageSummary
+from .timeline import PackageTimeline
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Parse a stored ISO timestamp into an aware UTC datetime."""
+    if not isinstance(value, str):
+        return None
+    parsed = dt_util.parse_datetime(value)
+    return dt_util.as_utc(parsed) if parsed else None
+
+
+def _fingerprint(data: Mapping) -> str:
+    """Return a stable digest of a normalized package payload."""
+    encoded = json.dumps(dict(data), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
 class Track17Coordinator(DataUpdateCoordinator):
     """Coordinator for fetching 17TRACK data.
 
-    This coordinator fetches tracking info concurrently with a small
-    semaphore to avoid hammering the API. It stores a list of tracking
-    numbers in the integration storage and exposes small helpers for
-    adding/removing/refreshing packages.
+    Wakes up every `SCHEDULER_TICK` and fetches, in batches of 40, the
+    packages the `PackageScheduler` reports as due. Listeners only hear
+    about packages whose payload changed (see `changed_numbers`), and
+    `summary` keeps the aggregate counts. Tracked numbers, cached payloads
+    and package metadata are persisted in the entry's storage.
     """
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, entry, hub=None):
         self.hass = hass
         self.entry = entry
-        self.api = Track17Api(entry.data["api_key"])
-        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.hub = hub
+        if hub is not None:
+            self.api = hub.get_api(entry.data["api_key"], entry.options)
+        else:
+            self.api = Track17Api(entry.data["api_key"])
+            configure_concurrency(self.api, entry.options)
+        # Refresh cycle cost of this entry; the client may be shared
+        self.cycle_metrics = CycleMetrics()
+        # One store per entry so several entries never overwrite each other
+        self.store = Track17Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
         self.tracking_numbers: List[str] = []
+        # When each package's data was last fetched successfully
+        self._fetched_at: Dict[str, datetime] = {}
         self._delivered_cache: Set[str] = set()
+        # Finished packages moved out of tracking_numbers: number -> summary
+        self.archive: Dict[str, Dict[str, Any]] = {}
+        # Numbers already registered with 17TRACK
+        self._registered: Set[str] = set()
+        self._archive_after = timedelta(
+            days=entry.options.get("archive_after_days", DEFAULT_ARCHIVE_AFTER_DAYS)
+        )
+        # Payload fingerprints kept across refreshes, and the numbers whose
+        # fingerprint changed in the most recent update.
+        self._fingerprints: Dict[str, str] = {}
+        # Append-only tracking event history per package
+        self.timeline = PackageTimeline()
+        # Per-package metadata persisted with the package (added_at, ...)
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self.changed_numbers: Set[str] = set()
+        # Counts by status, carrier and arrival, kept up to date incrementally
+        self.summary = PackageSummary()
+        self._quota_checked_at: Optional[datetime] = None
 
-        interval = entry.options.get("scan_interval", 24)
+        # scan_interval caps how long any active package goes unpolled. In
+        # push mode updates arrive through the webhook and polling is only
+        # a slow safety net.
+        interval = timedelta(hours=entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL_HOURS))
+        self.push_mode: bool = entry.options.get("push_mode", False)
+        if self.push_mode:
+            interval = max(interval, PUSH_SAFETY_INTERVAL)
+            self.scheduler = PackageScheduler(interval, min_interval=PUSH_SAFETY_INTERVAL)
+        else:
+            self.scheduler = PackageScheduler(interval)
 
         super().__init__(
             hass,
             logger=_LOGGER,
             name="17TRACK",
-            update_interval=timedelta(hours=interval),
+            update_interval=SCHEDULER_TICK,
+            # Skip listener callbacks when a refresh changed nothing
+            always_update=False,
         )
-
-        # Limit concurrent outgoing requests
-        self._concurrency = 5
+        # Publish completed chunks while a refresh is still running
+        self.incremental: bool = entry.options.get("incremental_refresh", False)
 
     async def async_load(self) -> None:
-        """Load tracking numbers from storage, ensuring a list is returned."""
+        """Load tracking numbers and cached payloads from storage.
+
+        Cached payloads become the initial coordinator data so sensors can
+        be created without waiting for the API. Entries fetched within
+        `CACHE_TTL` are scheduled normally; older ones are due on the first
+        refresh.
+        """
         try:
             stored = await self.store.async_load()
-            if isinstance(stored, list):
-                self.tracking_numbers = stored
-            else:
-                self.tracking_numbers = []
+            if stored is None:
+                stored = await self._async_load_legacy()
         except Exception as err:
             self.logger.exception("Failed to load stored tracking numbers: %s", err)
-            self.tracking_numbers = []
+            stored = None
 
-    async def async_save(self) -> None:
-        """Persist the tracking numbers list to storage."""
+        packages: Dict[str, Any] = {}
+        if isinstance(stored, dict):
+            numbers = stored.get("tracking_numbers")
+            packages = stored.get("packages") or {}
+            self._delivered_cache = set(stored.get("delivered") or [])
+            self.archive = dict(stored.get("archive") or {})
+            # Stores written before archived numbers kept the delivered flag
+            self._delivered_cache.update(
+                n for n, summary in self.archive.items() if summary.get("status") == "Delivered"
+            )
+            self._registered = set(stored.get("registered") or [])
+        else:
+            numbers = stored
+        self.tracking_numbers = list(numbers) if isinstance(numbers, list) else []
+
+        now = dt_util.utcnow()
+        data: Dict[str, Any] = {}
+        for number in self.tracking_numbers:
+            cached = packages.get(number)
+            if isinstance(cached, dict):
+                self._meta[number] = dict(cached.get("meta") or {})
+            if not isinstance(cached, dict) or not isinstance(cached.get("data"), dict):
+                continue
+            payload = PackageState.from_dict(cached["data"])
+            data[number] = payload
+            self.timeline.load(number, cached.get("history") or [])
+            # The stored fingerprint also covers the events, which are kept
+            # in the timeline rather than in the cached payload
+            self._fingerprints[number] = cached.get("fingerprint") or _fingerprint(payload)
+            self.summary.update(number, payload)
+            # A delivered package already seen before the restart must not
+            # fire the delivered event again.
+            if payload.get("status") == "Delivered":
+                self._delivered_cache.add(number)
+
+            fetched_at = _parse_time(cached.get("fetched_at"))
+            if fetched_at is not None and now - fetched_at < CACHE_TTL:
+                self._fetched_at[number] = fetched_at
+                self.scheduler.record(number, payload, fetched_at)
+
+        self.data = data
+
+    async def _async_load_legacy(self) -> Any:
+        """Move the data of the former shared store to this entry's store.
+
+        Before stores were per entry all data lived under `STORAGE_KEY`; the
+        first entry to load claims it.
+        """
+        legacy = Track17Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+        stored = await legacy.async_load()
+        if stored is not None:
+            await self.store.async_save(stored)
+            await legacy.async_remove()
+        return stored
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the storage payload: tracked numbers plus cached data."""
+        data = self.data or {}
+        packages: Dict[str, Any] = {}
+        for number in self.tracking_numbers:
+            packages[number] = {"meta": self._meta.get(number, {})}
+            payload = data.get(number)
+            if not isinstance(payload, Mapping) or "error" in payload:
+                continue
+            fetched_at = self._fetched_at.get(number)
+            packages[number].update({
+                "data": dict(payload),
+                "fetched_at": fetched_at.isoformat() if fetched_at else None,
+                "history": self.timeline.history(number) or [],
+                "fingerprint": self._fingerprints.get(number),
+            })
+        return {
+            "tracking_numbers": self.tracking_numbers,
+            "packages": packages,
+            # Archived numbers keep the flag: re-adding one must not fire
+            # track17_delivered again
+            "delivered": [
+                n for n in [*self.tracking_numbers, *self.archive] if n in self._delivered_cache
+            ],
+            "archive": self.archive,
+            "registered": [
+                n for n in [*self.tracking_numbers, *self.archive] if n in self._registered
+            ],
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Mark the stored data dirty; a burst of changes costs one write."""
+        self.store.async_schedule_save(self._data_to_save)
+
+    async def async_flush(self) -> None:
+        """Write pending changes to storage now."""
         try:
-            await self.store.async_save(self.tracking_numbers)
+            await self.store.async_flush()
         except Exception as err:
             self.logger.exception("Failed to save tracking numbers: %s", err)
 
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data for all tracked packages concurrently and return a mapping.
+        """Fetch the packages that are due and return the merged mapping.
 
-        The method uses a semaphore to limit concurrency and returns a mapping
-        of tracking_number -> data suitable for Coordinator consumers.
+        Nothing is fetched while the circuit breaker is open, and when the
+        quota budget is short the packages most likely to have changed go
+        first. Packages not fetched keep their previous data.
         """
-        results: Dict[str, Any] = {}
-        sem = asyncio.Semaphore(self._concurrency)
-
-        async def _fetch(number: str) -> Optional[Tuple[str, Any]]:
-            async with sem:
-                try:
-                    data = await self.api.async_get_tracking(number)
-
-                    # If data is a JSON string, try to parse it
-                    if isinstance(data, str):
-                        try:
-                            data = json.loads(data)
-                        except json.JSONDecodeError:
-                            self.logger.error("Invalid JSON for %s: %s", number, data)
-                            return None
-
-                    if not isinstance(data, dict):
-                        self.logger.error("Unexpected data format for %s: %s", number, type(data))
-                        return None
-
-                    return (number, data)
-                except Exception as exc:  # noqa: BLE001 - we want to catch all runtime errors
-                    self.logger.exception("Error fetching 17TRACK data for %s: %s", number, exc)
-                    return None
-
-        tasks = [asyncio.create_task(_fetch(num)) for num in self.tracking_numbers]
-
-        for task in asyncio.as_completed(tasks):
-            res = await task
-            if not res:
+        self.cycle_metrics.start()
+        due: List[str] = []
+        try:
+            if self._archive_finished(dt_util.utcnow()):
+                self.async_schedule_save()
+
+            if not self.api.breaker.allow():
+                self.logger.debug(
+                    "17TRACK circuit breaker open, skipping poll for another %.0fs",
+                    self.api.breaker.retry_in,
+                )
+                return self._merge_results({})
+
+            now = dt_util.utcnow()
+            due = self.scheduler.due(self.tracking_numbers, now)
+            if not due:
+                return self._merge_results({})
+
+            await self._async_update_quota()
+            allowed = self.api.quota.acquire(now, SCHEDULER_TICK, len(due))
+            if allowed < len(due):
+                self.logger.debug(
+                    "17TRACK quota budget allows %d of %d due packages this tick", allowed, len(due)
+                )
+                due = self.scheduler.prioritize(due, self.data or {}, now)[:allowed]
+                if not due:
+                    return self._merge_results({})
+
+            await self._async_register_missing(due)
+            if self.incremental:
+                batch = await self._async_fetch_incremental(due)
+            else:
+                batch = await self.api.async_get_tracking_batch(due)
+                self._share(batch)
+            return self._merge_results(batch)
+        finally:
+            self.cycle_metrics.end(len(due))
+
+    async def _async_register_missing(self, numbers: List[str]) -> None:
+        """Register the numbers in ``numbers`` not known to be registered."""
+        missing = [n for n in numbers if n not in self._registered]
+        if not missing:
+            return
+        replies = await self.api.async_register_batch(
+            missing, self._carrier_hints(missing)
+        )
+        self._registered.update(n for n, reply in replies.items() if "error" not in reply)
+
+    async def _async_fetch_incremental(self, numbers: List[str]) -> Dict[str, Any]:
+        """Fetch ``numbers`` and publish completed chunks during the cycle.
+
+        A chunk is published as soon as it is back, unless the last publish
+        is less than `STREAM_FLUSH_INTERVAL` old: then it is published, with
+        any chunk completing meanwhile, once the interval has passed. So
+        sensors never wait for the slowest request. Returns the results not
+        yet published.
+        """
+        pending: Dict[str, Any] = {}
+        last_flush: Optional[float] = None
+        timer: Optional[asyncio.TimerHandle] = None
+
+        @callback
+        def _flush() -> None:
+            nonlocal pending, last_flush, timer
+            timer = None
+            last_flush = time.monotonic()
+            batch, pending = pending, {}
+            merged = self._merge_results(batch)
+            if self.changed_numbers:
+                self._async_publish(merged)
+
+        try:
+            async for chunk in self.api.async_iter_batches("gettrackinfo", numbers):
+                pending.update(chunk)
+                self._share(chunk)
+                if timer is not None:
+                    continue
+                wait = 0.0
+                if last_flush is not None:
+                    wait = last_flush + STREAM_FLUSH_INTERVAL - time.monotonic()
+                if wait <= 0:
+                    _flush()
+                else:
+                    timer = asyncio.get_running_loop().call_later(wait, _flush)
+        finally:
+            if timer is not None:
+                timer.cancel()
+        return pending
+
+    def _archive_finished(self, now: datetime) -> List[str]:
+        """Move packages finished for longer than the grace period to the archive.
+
+        A package is finished once its status is in `FINAL_STATUSES`; the
+        grace period (option ``archive_after_days``) runs from its last
+        event. Archived packages are no longer polled and their sensors are
+        removed on the next update. Returns the archived numbers.
+        """
+        if self._archive_after <= timedelta(0):
+            return []
+        data = self.data or {}
+        archived: List[str] = []
+        for number in list(self.tracking_numbers):
+            payload = data.get(number) or {}
+            if payload.get("status") not in FINAL_STATUSES:
+                continue
+            finished_at = _parse_time(payload.get("lastEventTime")) or self._fetched_at.get(number)
+            if finished_at is None or now - finished_at < self._archive_after:
                 continue
-            number, data = res
+            self.archive[number] = {
+                "status": payload.get("status"),
+                "carrier": payload.get("carrier"),
+                "delivered_at": payload.get("deliveredAt"),
+                "archived_at": now.isoformat(),
+            }
+            self.tracking_numbers.remove(number)
+            self.scheduler.forget(number)
+            self.summary.discard(number)
+            archived.append(number)
+        if archived:
+            self.logger.debug("Archived finished packages: %s", archived)
+        return archived
+
+    async def _async_update_quota(self) -> None:
+        """Read the account quota at most every `QUOTA_REFRESH_INTERVAL`."""
+        now = dt_util.utcnow()
+        if self._quota_checked_at and now - self._quota_checked_at < QUOTA_REFRESH_INTERVAL:
+            return
+        quota = await self.api.async_get_quota()
+        if "error" in quota:
+            self.logger.debug("Could not read 17TRACK quota: %s", quota["error"])
+            return
+        self._quota_checked_at = now
+        self.api.metrics.update_quota(quota)
+
+    def _share(self, batch: Dict[str, Any]) -> None:
+        """Offer fetched results to other entries through the hub."""
+        if self.hub is not None:
+            self.hub.share(self, batch)
+
+    def _merge_results(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a batch result into a copy of the current data.
+
+        Failed numbers keep their last known data so a transient API error
+        does not blank out a sensor. Numbers no longer tracked are dropped.
+        Sets `changed_numbers`; when nothing changed the previous data
+        object itself is returned so the coordinator skips the update.
+        """
+        now = dt_util.utcnow()
+        previous = self.data or {}
+        results: Dict[str, Any] = {
+            number: previous[number] for number in self.tracking_numbers if number in previous
+        }
+        changed: Set[str] = set()
+
+        for number, data in batch.items():
+            if number not in self.tracking_numbers:
+                continue
+
+            if not isinstance(data, Mapping):
+                self.logger.error("Unexpected data format for %s: %s", number, type(data))
+                continue
+
+            self.scheduler.record(number, data, now)
+
+            if "error" in data:
+                self.logger.warning("Error fetching 17TRACK data for %s: %s", number, data["error"])
+                if data.get("code") == API_ERROR_NOT_REGISTERED:
+                    # Registration expired or was lost; register again next time
+                    self._registered.discard(number)
+                if number not in results:
+                    results[number] = data
+                    changed.add(number)
+                continue
+
+            self._fetched_at[number] = now
+            data = PackageState.from_dict(data)
+            fingerprint = _fingerprint(data)
+            if self._fingerprints.get(number) == fingerprint and number in results:
+                continue
+            self._fingerprints[number] = fingerprint
+            previous_status = (results.get(number) or {}).get("status")
+            if data.get("status") != previous_status:
+                self._meta.setdefault(number, {})["status_changed_at"] = now.isoformat()
+            changed.add(number)
+
+            # Fire a checkpoint event for each tracking event not seen before
+            for event in self.timeline.merge(number, data):
+                self.hass.bus.async_fire(
+                    EVENT_CHECKPOINT,
+                    {"tracking_number": number, "status": data.get("status"), **event},
+                )
+            # The timeline keeps the events from here on
+            if data.events:
+                data = data.replace(events=())
             results[number] = data
 
             # Fire delivery event if delivered and not already seen
             if data.get("status") == "Delivered" and number not in self._delivered_cache:
                 self._delivered_cache.add(number)
-                self.hass.bus.async_fire(EVENT_DELIVERED, {"tracking_number": number, "data": data})
+                self.hass.bus.async_fire(
+                    EVENT_DELIVERED, {"tracking_number": number, "data": dict(data)}
+                )
+
+        for number in set(self._fingerprints) - set(self.tracking_numbers):
+            del self._fingerprints[number]
+        for number in set(self._fetched_at) - set(self.tracking_numbers):
+            del self._fetched_at[number]
+        for number in set(self._meta) - set(self.tracking_numbers):
+            del self._meta[number]
+        self.timeline.prune(self.tracking_numbers)
 
+        if batch:
+            self.async_schedule_save()
+
+        for number in changed:
+            self.summary.update(number, results[number])
+
+        self.changed_numbers = changed
+        if not changed and results.keys() == previous.keys() and self.data is not None:
+            return self.data
         return results
 
-    async def async_add_package(self, number: str) -> bool:
-        """Add a package and request a refresh. Returns True if added."""
-        if not number or number in self.tracking_numbers:
-            return False
+    @callback
+    def async_handle_push(self, number: str, data: Dict[str, Any]) -> None:
+        """Apply a pushed update for a single package."""
+        if number not in self.tracking_numbers:
+            self.logger.debug("Ignoring 17TRACK push for untracked number %s", number)
+            return
+        self.async_apply_results({number: data})
+
+    @callback
+    def async_apply_results(self, batch: Dict[str, Any]) -> None:
+        """Merge results obtained outside a refresh and notify if changed."""
+        merged = self._merge_results(batch)
+        if self.changed_numbers:
+            self._async_publish(merged)
+
+    @callback
+    def _async_publish(self, data: Dict[str, Any]) -> None:
+        """Set data and notify listeners without resetting the poll timer."""
+        self.data = data
+        self.async_update_listeners()
+
+    def _validate_new_number(self, number: Any) -> Optional[str]:
+        """Return why ``number`` cannot be added, or None if it can."""
+        if not number or not isinstance(number, str):
+            return "Empty tracking number"
+        if number in self.tracking_numbers:
+            return "Already tracked"
 
         # Reject obvious template literals or UI-templating that were sent
         # verbatim from Lovelace. This prevents sensors like
         # `sensor.package_states_input_text_track17_new_package` being created
         # when a template string (e.g. "{{ states('input_text...') }}") is
         # accidentally passed as the tracking number.
-        if isinstance(number, str):
-            s = number.strip()
-            if (s.startswith("{{") and s.endswith("}}")) or "{{" in s or "}}" in s or "states(" in s:
-                self.logger.warning("Rejected template-like tracking number: %s", number)
-                return False
-        data = await self.api.async_get_tracking(number)
-        if isinstance(data, dict) and "error" in data:
-            self.logger.warning("Cannot add %s: %s", number, data.get("error"))
-            return False
+        s = number.strip()
+        if (s.startswith("{{") and s.endswith("}}")) or "{{" in s or "}}" in s or "states(" in s:
+            self.logger.warning("Rejected template-like tracking number: %s", number)
+            return "Template-like tracking number"
+        # Catch malformed numbers and typos offline instead of spending quota
+        return validate_tracking_number(number)
+
+    @staticmethod
+    def _carrier_hints(numbers: List[str]) -> Dict[str, int]:
+        """Return the 17TRACK carrier codes detected offline for ``numbers``."""
+        hints: Dict[str, int] = {}
+        for number in numbers:
+            match = detect_carrier(number)
+            if match and match.code:
+                hints[number] = match.code
+        return hints
+
+    async def async_add_package(self, number: str) -> bool:
+        """Add a package with a single API call.
 
-        self.tracking_numbers.append(number)
-        await self.async_save()
-        await self.async_request_refresh()
+        Returns True if added. Listeners are notified so the sensor platform
+        can create the new package sensor without reloading the entry.
+        """
+        result = (await self.async_add_packages([number])).get(number) or {}
+        if not result.get("success"):
+            self.logger.warning("Cannot add %s: %s", number, result.get("error"))
+            return False
         return True
 
+    async def async_add_packages(self, numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Add many packages with batched API calls and one update.
+
+        Every number is validated offline before any request is made (see
+        `validate_tracking_number`). Numbers not yet registered are
+        registered in batches of 40, with the carrier detected from the
+        number's format as a hint, and the register reply becomes their
+        first data; their first poll is scheduled
+        `POLL_INTERVAL_MIN` later, once 17TRACK had time to fetch events.
+        Only numbers registered earlier are fetched with ``gettrackinfo``.
+        Those that succeed are added together. Returns
+        ``{number: {"success": bool, "error": str, "carrier": str}}`` where
+        ``carrier`` is only present when detected offline.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        candidates: List[str] = []
+        for number in numbers:
+            if number in results or number in candidates:
+                continue
+            reason = self._validate_new_number(number)
+            if reason:
+                results[number] = {"success": False, "error": reason}
+            else:
+                candidates.append(number)
+
+        detected = {n: match for n in candidates if (match := detect_carrier(n))}
+        first_data: Dict[str, Any] = {}
+        to_fetch = [n for n in candidates if n in self._registered]
+        to_register = [n for n in candidates if n not in self._registered]
+        if to_register:
+            registered = await self.api.async_register_batch(
+                to_register, self._carrier_hints(to_register)
+            )
+            for number in to_register:
+                reply = registered.get(number, {"error": "Missing from response"})
+                if "error" in reply:
+                    results[number] = {"success": False, "error": reply["error"]}
+                    continue
+                self._registered.add(number)
+                if reply.get("already_registered"):
+                    to_fetch.append(number)
+                    continue
+                # No events yet: show the detected carrier name rather than
+                # the bare carrier code until the first poll.
+                match = detected.get(number)
+                if match and (not reply.get("carrier") or reply["carrier"] == match.code):
+                    reply = PackageState.from_dict(reply).replace(carrier=match.name)
+                first_data[number] = reply
+
+        if to_fetch:
+            batch = await self.api.async_get_tracking_batch(to_fetch)
+            self._share(batch)
+            for number in to_fetch:
+                data = batch.get(number, {"error": "Missing from response"})
+                if "error" in data:
+                    results[number] = {"success": False, "error": data["error"]}
+                else:
+                    first_data[number] = data
+
+        added = {n: first_data[n] for n in candidates if n in first_data}
+        if added:
+            self.tracking_numbers.extend(added)
+            added_at = dt_util.utcnow().isoformat()
+            for number in added:
+                self.archive.pop(number, None)
+                self._meta[number] = {"added_at": added_at}
+                results[number] = {"success": True}
+            self._async_publish(self._merge_results(added))
+            now = dt_util.utcnow()
+            for number in added:
+                if number not in to_fetch:
+                    self.scheduler.schedule(number, now + POLL_INTERVAL_MIN)
+            self.async_schedule_save()
+        for number, match in detected.items():
+            results[number]["carrier"] = match.name
+        return results
+
     async def async_remove_package(self, number: str) -> bool:
-        """Remove a package, delete its entity and request a refresh."""
-        if number not in self.tracking_numbers:
-            return False
-        try:
-            self.tracking_numbers.remove(number)
-            await self.async_save()
+        """Remove a package, delete its entity and notify listeners."""
+        result = await self.async_remove_packages([number])
+        return result[number]["success"]
+
+    async def async_remove_packages(self, numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Remove many packages with one listener update.
 
-            registry = er.async_get(self.hass)
-            entity_id = f"sensor.track17_{number}"
-            if entity := registry.async_get(entity_id):
-                registry.async_remove(entity.entity_id)
+        Archived numbers are dropped from the archive as well.
 
-            await self.async_request_refresh()
-            return True
+        Returns ``{number: {"success": bool, "error": str}}``.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        removed: List[str] = []
+        archive_size = len(self.archive)
+        for number in numbers:
+            if number in self.tracking_numbers:
+                self.tracking_numbers.remove(number)
+                self.scheduler.forget(number)
+                self.summary.discard(number)
+                removed.append(number)
+                results[number] = {"success": True}
+            elif self.archive.pop(number, None) is not None:
+                results[number] = {"success": True}
+            elif number not in results:
+                results[number] = {"success": False, "error": "Not tracked"}
+        if not removed:
+            if len(self.archive) != archive_size:
+                self.async_schedule_save()
+            return results
+
+        try:
+            self.async_schedule_save()
+            # The sensor platform removes the package sensors on this update
+            self._async_publish(self._merge_results({}))
         except Exception as exc:
-            self.logger.exception("Failed to remove package %s: %s", number, exc)
-            return False
+            self.logger.exception("Failed to remove packages %s: %s", removed, exc)
+            for number in removed:
+                results[number] = {"success": False, "error": str(exc)}
+        return results
 
     async def async_refresh_package(self, number: str) -> bool:
         """Refresh a single package and update coordinator data."""
@@ -159,13 +650,15 @@ class Track17Coordinator(DataUpdateCoordinator):
             return False
         data = await self.api.fetch_single(number)
         # fetch_single returns { number: data }
-        self.data.update(data)
-        self.async_set_updated_data(self.data)
+        self._share(data)
+        self.async_set_updated_data(self._merge_results(data))
         return True
 
     async def async_refresh_all_packages(self) -> None:
-        """Trigger a full refresh for all packages."""
-        await self.async_request_refresh()
+        """Refresh all packages now with a single batched fetch."""
+        batch = await self.api.async_get_tracking_batch(self.tracking_numbers)
+        self._share(batch)
+        self.async_set_updated_data(self._merge_results(batch))
 
     async def async_close(self) -> None:
         """Close internal resources (HTTP session)."""
@@ -0,0 +1,47 @@
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"api_key", "webhook_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Includes request latency percentiles, error counts by type, the cost of
+    the last refresh cycle, the last known quota and the circuit breaker
+    state, so growing polling cost is visible before the quota runs out.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "packages": {
+            "tracked": len(coordinator.tracking_numbers),
+            "with_data": len(coordinator.data or {}),
+            "summary": coordinator.summary.as_dict(),
+        },
+        "metrics": {**api.metrics.as_dict(), **coordinator.cycle_metrics.as_dict()},
+        "quota_budget": api.quota.as_dict(),
+        "circuit_breaker": {
+            "state": api.breaker.state,
+            "consecutive_failures": api.breaker.failures,
+            "retry_in_seconds": round(api.breaker.retry_in),
+        },
+        "rate_limiter": {"paused_for_seconds": round(api.rate_limiter.paused_for, 1)},
+        "concurrency": {
+            "limit": round(api.concurrency.limit, 2),
+            "in_flight": api.concurrency.in_flight,
+            "min": api.concurrency.min_limit,
+            "max": api.concurrency.max_limit,
+        },
+    }
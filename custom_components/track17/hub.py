@@ -0,0 +1,104 @@
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import Track17Api
+from .const import DATA_HUB, DEFAULT_MAX_CONCURRENCY, DEFAULT_MIN_CONCURRENCY
+
+
+def configure_concurrency(api: Track17Api, options: Mapping[str, Any]) -> None:
+    """Apply an entry's concurrency bounds options to ``api``."""
+    api.concurrency.configure(
+        options.get("min_concurrency", DEFAULT_MIN_CONCURRENCY),
+        options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+    )
+
+
+class Track17Hub:
+    """Domain-wide state shared by all 17TRACK config entries.
+
+    The hub owns one `Track17Api` per API key, all sending through Home
+    Assistant's pooled HTTP session, so entries using the same key share a
+    rate limiter, circuit breaker and quota. Results fetched for one entry
+    are handed to every other entry with the same key tracking those
+    numbers (see `share`), so a number tracked by several entries is
+    fetched once per cycle. Services look up the entry owning a number
+    through `coordinators_for`.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        # entry_id -> Track17Coordinator, in setup order
+        self.coordinators: Dict[str, Any] = {}
+        self._clients: Dict[str, Track17Api] = {}
+
+    def get_api(self, api_key: str, options: Optional[Mapping[str, Any]] = None) -> Track17Api:
+        """Return the shared client for ``api_key``, creating it if needed.
+
+        The client's concurrency bounds come from the ``options`` of the
+        entry that creates it; later entries on the same key share them.
+        """
+        if api_key not in self._clients:
+            client = Track17Api(api_key, session=async_get_clientsession(self.hass))
+            configure_concurrency(client, options or {})
+            self._clients[api_key] = client
+        return self._clients[api_key]
+
+    def add_coordinator(self, entry_id: str, coordinator) -> None:
+        self.coordinators[entry_id] = coordinator
+
+    def remove_coordinator(self, entry_id: str) -> None:
+        """Forget an entry and drop its client once no entry uses the key."""
+        coordinator = self.coordinators.pop(entry_id, None)
+        if coordinator is None:
+            return
+        api_key = coordinator.api.api_key
+        if not any(c.api.api_key == api_key for c in self.coordinators.values()):
+            self._clients.pop(api_key, None)
+
+    @property
+    def default_coordinator(self):
+        """The first loaded entry, used when a service names no entry."""
+        return next(iter(self.coordinators.values()), None)
+
+    def coordinators_for(self, number: str) -> List[Any]:
+        """Return the coordinators tracking ``number``."""
+        return [c for c in self.coordinators.values() if number in c.tracking_numbers]
+
+    def get_coordinator(self, entry_id: Optional[str]):
+        """Return the coordinator of ``entry_id``, or the default one."""
+        if entry_id is None:
+            return self.default_coordinator
+        return self.coordinators.get(entry_id)
+
+    @callback
+    def share(self, source, batch: Dict[str, Any]) -> None:
+        """Hand results fetched by ``source`` to the other entries on its key.
+
+        Only successful payloads are shared; each receiving coordinator
+        records them as fetched, so it does not request them again.
+        """
+        if not batch or len(self.coordinators) < 2:
+            return
+        for coordinator in self.coordinators.values():
+            if coordinator is source or coordinator.api is not source.api:
+                continue
+            shared = {
+                number: data
+                for number, data in batch.items()
+                if number in coordinator.tracking_numbers
+                and isinstance(data, Mapping)
+                and "error" not in data
+            }
+            if shared:
+                coordinator.async_apply_results(shared)
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> Track17Hub:
+    """Return the hub, creating it on first use."""
+    if DATA_HUB not in hass.data:
+        hass.data[DATA_HUB] = Track17Hub(hass)
+    return hass.data[DATA_HUB]
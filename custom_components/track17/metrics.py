@@ -0,0 +1,142 @@
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .const import METRICS_LATENCY_SAMPLES
+
+# The refresh cycle the running task works for; tasks started during a
+# cycle inherit it, so their requests count towards it
+_CURRENT_CYCLE: ContextVar[Optional["CycleMetrics"]] = ContextVar(
+    "track17_cycle", default=None
+)
+
+
+def classify_error(message: Any) -> str:
+    """Map an API error message from `Track17Api` to a short error type."""
+    text = str(message)
+    if text == "Rate limited":
+        return "rate_limited"
+    if text == "API request timed out":
+        return "timeout"
+    if text == "Circuit breaker open":
+        return "circuit_open"
+    if text.startswith("HTTP error"):
+        return "connection"
+    if text.startswith("HTTP "):
+        return "server_error"
+    if text in ("Invalid JSON response", "Unexpected data format"):
+        return "bad_response"
+    return "api_error"
+
+
+def _percentile(ordered: List[float], pct: float) -> Optional[float]:
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _Listeners:
+    def __init__(self):
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` on every update; returns a function removing it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+
+class ApiMetrics(_Listeners):
+    """Request counters for one API client.
+
+    Keeps a rolling window of request latencies, error counts by type and
+    the last known 17TRACK quota. The client may be shared by several
+    entries, so refresh cycles are measured per coordinator by
+    `CycleMetrics`. Listeners are called when the quota is updated.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.latencies: Deque[float] = deque(maxlen=METRICS_LATENCY_SAMPLES)
+        self.requests_total = 0
+        self.errors: Counter = Counter()
+        self.quota: Dict[str, Any] = {}
+
+    def record_request(self, latency: float, error: Any = None) -> None:
+        """Record one HTTP attempt and its error message, if any."""
+        self.requests_total += 1
+        cycle = _CURRENT_CYCLE.get()
+        if cycle is not None:
+            cycle.requests += 1
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[classify_error(error)] += 1
+
+    def record_skipped(self, error: Any) -> None:
+        """Record a request that was not sent (e.g. circuit open)."""
+        self.errors[classify_error(error)] += 1
+
+    def update_quota(self, quota: Dict[str, Any]) -> None:
+        self.quota = dict(quota)
+        self._notify()
+
+    def latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """Return p50/p90/p99 request latency in milliseconds."""
+        ordered = sorted(self.latencies)
+        return {
+            f"p{pct}": None if (value := _percentile(ordered, pct)) is None else round(value * 1000, 1)
+            for pct in (50, 90, 99)
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests_total": self.requests_total,
+            "latency_ms": self.latency_percentiles(),
+            "errors": dict(self.errors),
+            "quota": self.quota,
+        }
+
+
+class CycleMetrics(_Listeners):
+    """Cost of one coordinator's refresh cycles.
+
+    Requests are counted for the cycle of the task that sends them, so
+    entries refreshing at the same time through a shared client each see
+    their own requests. Listeners are called when a cycle ends.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.cycles = 0
+        self.last_cycle: Dict[str, Any] = {}
+        self.requests = 0
+        self._start: Optional[float] = None
+        self._token = None
+
+    def start(self) -> None:
+        """Start a cycle in the current task."""
+        self._start = time.monotonic()
+        self.requests = 0
+        self._token = _CURRENT_CYCLE.set(self)
+
+    def end(self, packages: int) -> None:
+        """Close the cycle started by `start` after fetching ``packages``."""
+        if self._start is None:
+            return
+        _CURRENT_CYCLE.reset(self._token)
+        self.cycles += 1
+        self.last_cycle = {
+            "duration": round(time.monotonic() - self._start, 3),
+            "requests": self.requests,
+            "packages": packages,
+        }
+        self._start = self._token = None
+        self._notify()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"cycles": self.cycles, "last_cycle": self.last_cycle}
@@ -0,0 +1,119 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .timeline import extract_events
+
+# Flat payload keys read by sensors, the scheduler and the archive -> slot
+_KEYS = {
+    "number": "number",
+    "status": "status",
+    "subStatus": "sub_status",
+    "carrier": "carrier",
+    "country": "country",
+    "lastEvent": "last_event",
+    "lastEventTime": "last_event_time",
+    "deliveredAt": "delivered_at",
+    "estimatedDelivery": "estimated_delivery",
+    "events": "events",
+}
+
+
+class PackageState(Mapping):
+    """The fields of one package that sensors and events use.
+
+    A 17TRACK ``accepted`` item is projected once, when the response is
+    decoded, and the raw item is dropped. The record is a read-only mapping
+    over the flat keys the rest of the integration reads (``status``,
+    ``carrier``, ``lastEventTime``, ...); unset fields are left out, so it
+    compares equal to the plain dict of its set fields. ``events`` is only
+    carried until the coordinator has merged them into the package
+    timeline. Treat instances as immutable and use `replace` to change one.
+    """
+
+    __slots__ = tuple(_KEYS.values())
+
+    def __init__(
+        self,
+        number: Optional[str] = None,
+        status: Optional[str] = None,
+        sub_status: Optional[str] = None,
+        carrier: Any = None,
+        country: Optional[str] = None,
+        last_event: Optional[str] = None,
+        last_event_time: Optional[str] = None,
+        delivered_at: Optional[str] = None,
+        estimated_delivery: Optional[str] = None,
+        events: Tuple[Dict[str, Any], ...] = (),
+    ):
+        self.number = number
+        self.status = status
+        self.sub_status = sub_status
+        self.carrier = carrier
+        self.country = country
+        self.last_event = last_event
+        self.last_event_time = last_event_time
+        self.delivered_at = delivered_at
+        self.estimated_delivery = estimated_delivery
+        self.events = tuple(events)
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "PackageState":
+        """Project a v2.4 ``accepted`` item (or pushed ``data``)."""
+        track_info = item.get("track_info") or {}
+        latest_status = track_info.get("latest_status") or {}
+        latest_event = track_info.get("latest_event") or {}
+        recipient = (track_info.get("shipping_info") or {}).get("recipient_address") or {}
+        eta = (track_info.get("time_metrics") or {}).get("estimated_delivery_date") or {}
+        providers = (track_info.get("tracking") or {}).get("providers") or []
+        provider = (providers[0].get("provider") or {}) if providers else {}
+
+        status = latest_status.get("status")
+        event_time = latest_event.get("time_iso")
+        return cls(
+            number=item.get("number"),
+            status=status,
+            sub_status=latest_status.get("sub_status"),
+            carrier=provider.get("name") or item.get("carrier"),
+            country=recipient.get("country"),
+            last_event=latest_event.get("description"),
+            last_event_time=event_time,
+            delivered_at=event_time if status == "Delivered" else None,
+            # Latest possible arrival when 17TRACK gives a window
+            estimated_delivery=eta.get("to") or eta.get("from"),
+            events=extract_events(item),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "PackageState":
+        """Build a record from flat keys, or from a raw item still carrying
+        ``track_info`` (payloads cached before records existed).
+        """
+        if isinstance(data, cls):
+            return data
+        if "track_info" in data:
+            return cls.from_item(data)
+        return cls(**{slot: data[key] for key, slot in _KEYS.items() if data.get(key) is not None})
+
+    def replace(self, **changes: Any) -> "PackageState":
+        """Return a copy with the given fields (slot names) changed."""
+        fields = {slot: getattr(self, slot) for slot in _KEYS.values()}
+        return type(self)(**{**fields, **changes})
+
+    def __getitem__(self, key: str) -> Any:
+        slot = _KEYS.get(key)
+        value = getattr(self, slot) if slot else None
+        if value is None or value == ():
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in _KEYS.items():
+            value = getattr(self, slot)
+            if value is not None and value != ():
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"PackageState({dict(self)!r})"
@@ -0,0 +1,133 @@
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.util import dt as dt_util
+
+from .const import QUOTA_BUDGET_PERIOD, QUOTA_HORIZON, QUOTA_RESERVE_FRACTION
+
+
+class QuotaBudget:
+    """Turn the 17TRACK account quota into a polling budget.
+
+    The quota read from ``getquota`` is combined with a local count of the
+    numbers requested since, giving an estimate of what is left. Each budget
+    period (a UTC day) gets an equal share of the usable quota over
+    `QUOTA_HORIZON`, capped by the daily limit when the account has one, and
+    that allowance is spread evenly over the refresh ticks left in the
+    period. As the remaining quota shrinks so does every tick's budget, so
+    polling slows down instead of failing partway through a cycle.
+
+    The client, and so its budget, may be shared by several entries: each
+    tick's budget is handed out once, through `acquire`, whichever entries
+    refresh during that tick.
+    """
+
+    def __init__(self):
+        self.quota_total: Optional[int] = None
+        self.quota_remain: Optional[int] = None
+        self.daily_remain: Optional[int] = None
+        self.used_since_update = 0
+        self._period_start: Optional[datetime] = None
+        self._period_allowance = 0
+        self._period_used = 0
+        self._tick_start: Optional[datetime] = None
+        self._tick_left = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Estimated quota left, or None before the first quota read."""
+        if self.quota_remain is None:
+            return None
+        return max(self.quota_remain - self.used_since_update, 0)
+
+    def update(self, quota: Dict[str, Any]) -> None:
+        """Apply a ``getquota`` response."""
+        self.quota_total = _as_int(quota.get("quota_total"))
+        self.quota_remain = _as_int(quota.get("quota_remain"))
+        daily_max = _as_int(quota.get("max_track_daily"))
+        today_used = _as_int(quota.get("today_used"))
+        self.daily_remain = (
+            max(daily_max - today_used, 0) if daily_max is not None and today_used is not None else None
+        )
+        self.used_since_update = 0
+        # The allowance is fixed when a period starts; a fresh read only
+        # lowers it, when less quota is left than the period still expects
+        if self._period_start is not None:
+            self._period_allowance = min(
+                self._period_allowance, self._period_used + self._usable()
+            )
+
+    def record_usage(self, numbers: int) -> None:
+        """Count ``numbers`` tracking numbers requested from the API."""
+        self.used_since_update += numbers
+        self._period_used += numbers
+        if self.daily_remain is not None:
+            self.daily_remain = max(self.daily_remain - numbers, 0)
+
+    def _usable(self) -> int:
+        """Quota that may still be spent: the estimate less the reserve."""
+        reserve = math.ceil((self.quota_total or 0) * QUOTA_RESERVE_FRACTION)
+        usable = max((self.remaining or 0) - reserve, 0)
+        if self.daily_remain is not None:
+            usable = min(usable, self.daily_remain)
+        return usable
+
+    def budget(self, now: datetime, tick: timedelta) -> Optional[int]:
+        """Return how many packages may still be polled this tick (None = no limit)."""
+        remaining = self.remaining
+        if remaining is None:
+            return None
+
+        period_start = _period_start(now)
+        if self._period_start != period_start:
+            self._period_start = period_start
+            self._period_used = 0
+            reserve = math.ceil((self.quota_total or 0) * QUOTA_RESERVE_FRACTION)
+            usable = max(remaining - reserve, 0)
+            allowance = math.ceil(usable * (QUOTA_BUDGET_PERIOD / QUOTA_HORIZON))
+            if self.daily_remain is not None:
+                allowance = min(allowance, self.daily_remain)
+            self._period_allowance = allowance
+
+        tick_start = period_start + tick * ((now - period_start) // tick)
+        if self._tick_start != tick_start:
+            self._tick_start = tick_start
+            left = max(self._period_allowance - self._period_used, 0)
+            period_end = period_start + QUOTA_BUDGET_PERIOD
+            ticks_left = max(math.ceil((period_end - now) / tick), 1)
+            self._tick_left = math.ceil(left / ticks_left)
+        return self._tick_left
+
+    def acquire(self, now: datetime, tick: timedelta, wanted: int) -> int:
+        """Take up to ``wanted`` packages from this tick's budget.
+
+        Returns how many may be polled; what is taken is no longer
+        available to other entries refreshing during the same tick.
+        """
+        budget = self.budget(now, tick)
+        if budget is None:
+            return wanted
+        granted = min(budget, wanted)
+        self._tick_left -= granted
+        return granted
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "quota_total": self.quota_total,
+            "estimated_remaining": self.remaining,
+            "daily_remaining": self.daily_remain,
+            "period_allowance": self._period_allowance,
+            "period_used": self._period_used,
+        }
+
+
+def _period_start(now: datetime) -> datetime:
+    return dt_util.as_utc(now).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,163 @@
+import asyncio
+import random
+import time
+from typing import Callable, List, Optional
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class TokenBucket:
+    """Async token bucket shared by every request of one API client.
+
+    ``rate`` tokens are added per second up to ``capacity``. `pause` blocks
+    all callers until a point in time, which is how a 429 ``Retry-After``
+    is honoured for every in-flight and queued request at once.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left before requests may be sent again."""
+        return max(self._paused_until - time.monotonic(), 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for at least ``seconds``."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of requests in flight.
+
+    Every request answered within ``latency_target`` grows the limit by
+    ``1 / limit`` (about one more slot per round of requests); a timeout,
+    429, 5xx or connection error halves it. Only requests started after
+    the last decrease can decrease it again, so a burst of failures from
+    one overloaded moment counts once. The limit stays within
+    ``[min_limit, max_limit]``; slow but successful requests hold it.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, start: float, latency_target: float):
+        self.latency_target = latency_target
+        self.min_limit = 1
+        self.max_limit = 1
+        self.limit = float(start)
+        self.configure(min_limit, max_limit)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = asyncio.Condition()
+
+    def configure(self, min_limit: int, max_limit: int) -> None:
+        """Set the bounds, clamping the current limit into them."""
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(self.limit, self.min_limit), self.max_limit)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """Give a slot back and wake waiters (the limit may have grown)."""
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, started: float, latency: float, overloaded: bool) -> None:
+        """Adjust the limit from one request started at ``started``."""
+        if overloaded:
+            if started >= self._last_decrease:
+                self.limit = max(self.min_limit, self.limit / 2)
+                self._last_decrease = time.monotonic()
+        elif latency <= self.latency_target:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+class CircuitBreaker:
+    """Stop calling the API for a cooldown after repeated failures.
+
+    After ``threshold`` consecutive failed requests the circuit opens and
+    `allow` returns False for ``cooldown`` seconds. The first request after
+    the cooldown is a trial (half open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the open circuit allows a trial request."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + self.cooldown - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        return self.state != CIRCUIT_OPEN
+
+    def record_success(self) -> None:
+        changed = self.opened_at is not None
+        self.failures = 0
+        self.opened_at = None
+        if changed:
+            self._notify()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+            self._notify()
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` whenever the circuit opens or closes.
+
+        Returns a function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
@@ -0,0 +1,110 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    FINAL_STATUSES,
+    HOT_STATUSES,
+    POLL_AGE_DIVISOR,
+    POLL_INTERVAL_ERROR,
+    POLL_INTERVAL_MIN,
+    POLL_INTERVAL_UNKNOWN,
+)
+
+
+def compute_poll_interval(
+    data: Dict[str, Any],
+    now: datetime,
+    max_interval: timedelta,
+    min_interval: timedelta = POLL_INTERVAL_MIN,
+) -> Optional[timedelta]:
+    """Return how long to wait before polling a package again.
+
+    Returns None when the package has reached a final status and should not
+    be polled any more. Otherwise the interval grows with the age of the
+    last tracking event: a package that moved an hour ago is polled again
+    soon, one that has been silent for a week backs off to ``max_interval``.
+    Raising ``min_interval`` (push mode) turns polling into a slow sweep.
+    """
+    if "error" in data:
+        return min(POLL_INTERVAL_ERROR, max_interval)
+
+    if data.get("status") in FINAL_STATUSES:
+        return None
+
+    event_time = data.get("lastEventTime")
+    parsed = dt_util.parse_datetime(event_time) if isinstance(event_time, str) else None
+    if parsed is None:
+        return min(max(POLL_INTERVAL_UNKNOWN, min_interval), max_interval)
+
+    age = max(now - dt_util.as_utc(parsed), timedelta(0))
+    return min(max(age / POLL_AGE_DIVISOR, min_interval), max_interval)
+
+
+class PackageScheduler:
+    """Keep a next-due time for each tracked package.
+
+    Packages that have never been fetched are always due. Packages in a
+    final state (delivered/expired) are never due again.
+    """
+
+    def __init__(self, max_interval: timedelta, min_interval: timedelta = POLL_INTERVAL_MIN):
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self._next_due: Dict[str, Optional[datetime]] = {}
+
+    def due(self, numbers: Iterable[str], now: datetime) -> List[str]:
+        """Return the numbers that should be fetched at ``now``."""
+        due: List[str] = []
+        for number in numbers:
+            if number not in self._next_due:
+                due.append(number)
+                continue
+            next_due = self._next_due[number]
+            if next_due is not None and next_due <= now:
+                due.append(number)
+        return due
+
+    def record(self, number: str, data: Dict[str, Any], now: datetime) -> None:
+        """Schedule the next poll of ``number`` after fetching ``data``."""
+        interval = compute_poll_interval(data, now, self.max_interval, self.min_interval)
+        self._next_due[number] = None if interval is None else now + interval
+
+    def prioritize(
+        self, numbers: List[str], data: Dict[str, Any], now: datetime
+    ) -> List[str]:
+        """Order due ``numbers`` by how likely they are to have changed.
+
+        Packages never fetched and those in `HOT_STATUSES` come first, then
+        the rest by poll interval (shorter means more active). Time spent
+        overdue is subtracted so skipped packages move up and are not
+        starved when the budget is tight.
+        """
+        def _key(number: str):
+            payload = data.get(number)
+            if not isinstance(payload, Mapping) or number not in self._next_due:
+                return (0, timedelta(0))
+            if payload.get("status") in HOT_STATUSES:
+                return (0, timedelta(0))
+            interval = compute_poll_interval(
+                payload, now, self.max_interval, self.min_interval
+            ) or self.max_interval
+            next_due = self._next_due.get(number)
+            overdue = now - next_due if next_due else timedelta(0)
+            return (1, interval - overdue)
+
+        return sorted(numbers, key=_key)
+
+    def schedule(self, number: str, when: datetime) -> None:
+        """Set the next due time of ``number`` explicitly."""
+        self._next_due[number] = when
+
+    def next_due(self, number: str) -> Optional[datetime]:
+        """Return the next due time for ``number`` (None if stopped)."""
+        return self._next_due.get(number)
+
+    def forget(self, number: str) -> None:
+        """Stop tracking the schedule for a removed package."""
+        self._next_due.pop(number, None)
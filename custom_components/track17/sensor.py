@@ -1,18 +1,199 @@
-from homeassistant.components.sensor import SensorEntity
+from dataclasses import dataclass
+import re
+from typing import Any, Callable, Dict
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
 from .device import track17_device_info
-from .const import DOMAIN
+from .const import DOMAIN, PACKAGE_STATUSES
+from .summary import PackageSummary
+
+
+@dataclass(frozen=True, kw_only=True)
+class Track17MetricDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor backed by `ApiMetrics` or `CycleMetrics`."""
+
+    value_fn: Callable[[Any], Any]
+    attrs_fn: Callable[[Any], Dict[str, Any]] = lambda metrics: {}
+    # The metrics object passed to value_fn/attrs_fn
+    metrics_fn: Callable[[Any], Any] = lambda coordinator: coordinator.api.metrics
+
+
+METRIC_SENSORS = (
+    Track17MetricDescription(
+        key="api_latency",
+        name="17TRACK API Latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.latency_percentiles()["p90"],
+        attrs_fn=lambda metrics: {
+            **metrics.latency_percentiles(),
+            "requests_total": metrics.requests_total,
+            "errors": dict(metrics.errors),
+        },
+    ),
+    Track17MetricDescription(
+        key="cycle_requests",
+        name="17TRACK Requests Last Refresh",
+        icon="mdi:counter",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.last_cycle.get("requests"),
+        attrs_fn=lambda metrics: {"packages": metrics.last_cycle.get("packages")},
+        metrics_fn=lambda coordinator: coordinator.cycle_metrics,
+    ),
+    Track17MetricDescription(
+        key="cycle_duration",
+        name="17TRACK Refresh Duration",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.last_cycle.get("duration"),
+        metrics_fn=lambda coordinator: coordinator.cycle_metrics,
+    ),
+    Track17MetricDescription(
+        key="quota_remaining",
+        name="17TRACK Quota Remaining",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.quota.get("quota_remain"),
+        attrs_fn=lambda metrics: {
+            "quota_total": metrics.quota.get("quota_total"),
+            "quota_used": metrics.quota.get("quota_used"),
+        },
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Track17SummaryDescription(SensorEntityDescription):
+    """Describes a sensor backed by the coordinator's `PackageSummary`."""
+
+    value_fn: Callable[[PackageSummary], Any]
+
+
+STATUS_ICONS = {
+    "OutForDelivery": "mdi:truck-delivery",
+    "AvailableForPickup": "mdi:package-variant-closed-check",
+    "Delivered": "mdi:package-variant-closed-check",
+    "DeliveryFailure": "mdi:alert-circle-outline",
+    "Exception": "mdi:alert-circle-outline",
+}
+
+
+def _status_description(status: str) -> Track17SummaryDescription:
+    words = re.sub(r"(?<!^)(?=[A-Z])", " ", status)
+    return Track17SummaryDescription(
+        key=f"status_{slugify(words)}",
+        name=f"Packages {words}",
+        icon=STATUS_ICONS.get(status, "mdi:package-variant"),
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda summary: summary.statuses[status],
+    )
+
+
+def _carrier_description(carrier: str) -> Track17SummaryDescription:
+    return Track17SummaryDescription(
+        key=f"carrier_{slugify(carrier)}",
+        name=f"Packages via {carrier}",
+        icon="mdi:truck",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda summary: summary.carriers[carrier],
+    )
+
+
+STATUS_SENSORS = tuple(_status_description(status) for status in PACKAGE_STATUSES)
+
+ARRIVING_TODAY_SENSOR = Track17SummaryDescription(
+    key="arriving_today",
+    name="Packages Arriving Today",
+    icon="mdi:calendar-today",
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda summary: summary.arriving_today(),
+)
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    package_sensors: Dict[str, "Track17PackageSensor"] = {}
+    carrier_sensors: Dict[str, "Track17SummarySensor"] = {}
+
+    @callback
+    def _async_remove_sensor(sensor: SensorEntity) -> None:
+        registry = er.async_get(hass)
+        if sensor.entity_id and registry.async_get(sensor.entity_id):
+            # Removing the registry entry also removes the entity
+            registry.async_remove(sensor.entity_id)
+        else:
+            hass.async_create_task(sensor.async_remove(force_remove=True))
+
+    @callback
+    def _async_sync_package_sensors() -> bool:
+        """Add and remove package sensors to match the tracked numbers.
 
-    entities = [Track17PackageList(coordinator)]
+        Runs on every coordinator update, so adding or removing a package
+        only touches its own sensor instead of reloading the entry.
+        Returns whether a package was removed.
+        """
+        current = set(coordinator.tracking_numbers)
+        removed = [n for n in package_sensors if n not in current]
+        for number in removed:
+            _async_remove_sensor(package_sensors.pop(number))
 
-    # dynamically add package sensors
-    for number in coordinator.tracking_numbers:
-        entities.append(Track17PackageSensor(coordinator, number))
+        new_sensors = [
+            Track17PackageSensor(coordinator, number)
+            for number in coordinator.tracking_numbers
+            if number not in package_sensors
+        ]
+        for sensor in new_sensors:
+            package_sensors[sensor.tracking_number] = sensor
+        if new_sensors:
+            async_add_entities(new_sensors)
+        return bool(removed)
 
-    async_add_entities(entities, True)
+    @callback
+    def _async_sync_carrier_sensors(prune: bool) -> None:
+        """Add a sensor for each new carrier.
+
+        A carrier whose count drops to 0 keeps its sensor until a package
+        removal (``prune``), so a package changing carrier does not churn
+        the entity registry.
+        """
+        carriers = coordinator.summary.carriers
+        if prune:
+            for carrier in [c for c in carrier_sensors if c not in carriers]:
+                _async_remove_sensor(carrier_sensors.pop(carrier))
+
+        new_sensors = []
+        for carrier in carriers:
+            if carrier not in carrier_sensors:
+                sensor = Track17SummarySensor(coordinator, _carrier_description(carrier))
+                carrier_sensors[carrier] = sensor
+                new_sensors.append(sensor)
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    @callback
+    def _async_sync_sensors() -> None:
+        _async_sync_carrier_sensors(prune=_async_sync_package_sensors())
+
+    async_add_entities(
+        [Track17PackageList(coordinator), Track17ApiStatusSensor(coordinator)]
+        + [Track17MetricSensor(coordinator, description) for description in METRIC_SENSORS]
+        + [Track17SummarySensor(coordinator, description) for description in STATUS_SENSORS]
+        + [Track17ArrivingTodaySensor(coordinator, ARRIVING_TODAY_SENSOR)]
+    )
+    _async_sync_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_sensors))
 
 
 class Track17PackageList(CoordinatorEntity, SensorEntity):
@@ -21,7 +202,22 @@ class Track17PackageList(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_name = "Tracked Packages"
-        self._attr_unique_id = f"{DOMAIN}_packages"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_packages"
+        self._written = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Only the list of numbers feeds this sensor, so package data
+        # changes alone don't need a state write.
+        written = (
+            self.available,
+            tuple(self.coordinator.tracking_numbers),
+            len(self.coordinator.archive),
+        )
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
 
     @property
     def state(self):
@@ -29,7 +225,10 @@ class Track17PackageList(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
-        return {"packages": self.coordinator.tracking_numbers}
+        return {
+            "packages": self.coordinator.tracking_numbers,
+            "archived": len(self.coordinator.archive),
+        }
 
     @property
     def device_info(self):
@@ -43,7 +242,25 @@ class Track17PackageSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._number = number
         self._attr_name = f"Package {number}"
-        self._attr_unique_id = f"{DOMAIN}_{number}"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_{number}"
+        self._written_available = None
+
+    @property
+    def tracking_number(self):
+        return self._number
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # The coordinator notifies every listener; only write state when
+        # this package's payload (or availability) actually changed.
+        available = self.available
+        if (
+            self._number not in self.coordinator.changed_numbers
+            and available == self._written_available
+        ):
+            return
+        self._written_available = available
+        super()._handle_coordinator_update()
 
     @property
     def state(self):
@@ -58,9 +275,129 @@ class Track17PackageSensor(CoordinatorEntity, SensorEntity):
             "country": d.get("country"),
             "last_event": d.get("lastEvent"),
             "delivered_at": d.get("deliveredAt"),
+            "estimated_delivery": d.get("estimatedDelivery"),
             "url": f"https://t.17track.net/en#nums={self._number}",
         }
 
     @property
     def device_info(self):
         return track17_device_info(self.coordinator.entry)
+
+
+class Track17SummarySensor(CoordinatorEntity, SensorEntity):
+    """Sensor counting packages from the coordinator's `PackageSummary`."""
+
+    entity_description: Track17SummaryDescription
+
+    def __init__(self, coordinator, description: Track17SummaryDescription):
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_{description.key}"
+        self._written = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # The counts are kept by the coordinator; only write when ours moved
+        written = (self.available, self.native_value)
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self.coordinator.summary)
+
+    @property
+    def device_info(self):
+        return track17_device_info(self.coordinator.entry)
+
+
+class Track17ArrivingTodaySensor(Track17SummarySensor):
+    """Packages out for delivery or estimated to arrive today.
+
+    Also re-evaluated at midnight, when the estimated dates that count as
+    "today" change without any package update.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_new_day, hour=0, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_new_day(self, now) -> None:
+        self._handle_coordinator_update()
+
+
+class Track17ApiStatusSensor(SensorEntity):
+    """Diagnostic sensor showing the API circuit breaker state."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:api"
+
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+        self._attr_name = "17TRACK API Status"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_api_status"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.api.breaker.add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def state(self):
+        return self.coordinator.api.breaker.state
+
+    @property
+    def extra_state_attributes(self):
+        breaker = self.coordinator.api.breaker
+        return {
+            "consecutive_failures": breaker.failures,
+            "retry_in_seconds": round(breaker.retry_in),
+        }
+
+    @property
+    def device_info(self):
+        return track17_device_info(self.coordinator.entry)
+
+
+class Track17MetricSensor(SensorEntity):
+    """Diagnostic sensor exposing one API/refresh metric."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: Track17MetricDescription
+
+    def __init__(self, coordinator, description: Track17MetricDescription):
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Written after each refresh cycle of this entry and quota update
+        for metrics in (self.coordinator.cycle_metrics, self.coordinator.api.metrics):
+            self.async_on_remove(metrics.add_listener(self.async_write_ha_state))
+
+    @property
+    def _metrics(self):
+        return self.entity_description.metrics_fn(self.coordinator)
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self):
+        return self.entity_description.attrs_fn(self._metrics)
+
+    @property
+    def device_info(self):
+        return track17_device_info(self.coordinator.entry)
@@ -0,0 +1,99 @@
+from typing import Any, Callable, Dict, Optional
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_MINOR_VERSION, STORAGE_SAVE_DELAY
+
+
+class Track17Store(Store):
+    """Store holding the tracked numbers and a cache of their payloads.
+
+    Schema (version 2.4)::
+
+        {
+            "tracking_numbers": ["LP123..."],
+            "packages": {
+                "LP123...": {
+                    "data": {...},
+                    "fetched_at": "<iso>",
+                    "history": [...],
+                    "meta": {"added_at": "<iso>", "status_changed_at": "<iso>"},
+                },
+            },
+            "delivered": ["LP123..."],
+            "registered": ["LP123...", "RR456..."],
+            "archive": {"RR456...": {"status": "Delivered", "archived_at": "<iso>", ...}},
+        }
+
+    ``history`` is the package's compact event timeline (optional, added
+    without a version bump since older entries simply have none).
+    ``delivered`` lists tracked numbers whose delivered event already fired
+    and ``archive`` holds finished packages that are no longer polled.
+    ``registered`` lists numbers already registered with 17TRACK. Every
+    tracked number has a ``packages`` entry holding at least its ``meta``;
+    ``data``, ``fetched_at`` and ``history`` are present once fetched.
+    Version 1 stored a bare list of tracking numbers; 2.1 had no
+    ``delivered`` or ``archive`` keys, 2.2 no ``registered`` key (those
+    numbers are registered again, once, on the next refresh) and 2.3 no
+    ``meta``.
+
+    Writes go through `async_schedule_save`, which coalesces a burst of
+    changes into one write, and `async_flush`.
+    """
+
+    def __init__(self, hass, version: int, key: str):
+        super().__init__(hass, version, key, minor_version=STORAGE_MINOR_VERSION)
+        self._dirty = False
+        self._data_func: Optional[Callable[[], Dict[str, Any]]] = None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether changes are waiting to be written."""
+        return self._dirty
+
+    @callback
+    def async_schedule_save(
+        self, data_func: Callable[[], Dict[str, Any]], delay: float = STORAGE_SAVE_DELAY
+    ) -> None:
+        """Mark the data dirty and write it ``delay`` seconds later.
+
+        Only the first change of a burst schedules the write; later changes
+        ride along since ``data_func`` is only called when writing. Unlike
+        re-arming the delay on every call, a steady stream of changes cannot
+        postpone the write forever. Pending data is also written when Home
+        Assistant stops.
+        """
+        self._data_func = data_func
+        if self._dirty:
+            return
+        self._dirty = True
+        self.async_delay_save(self._collect, delay)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now (e.g. when the entry is unloaded)."""
+        if self._dirty:
+            await self.async_save(self._collect())
+
+    def _collect(self) -> Dict[str, Any]:
+        self._dirty = False
+        return self._data_func()
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> Dict[str, Any]:
+        if old_major_version == 1:
+            numbers = old_data if isinstance(old_data, list) else []
+            old_data = {"tracking_numbers": numbers, "packages": {}}
+            old_minor_version = 1
+        if old_major_version > 2:
+            raise NotImplementedError
+        if old_minor_version < 2:
+            old_data.setdefault("delivered", [])
+            old_data.setdefault("archive", {})
+        if old_minor_version < 3:
+            old_data.setdefault("registered", [])
+        if old_minor_version < 4:
+            for package in (old_data.get("packages") or {}).values():
+                package.setdefault("meta", {})
+        return old_data
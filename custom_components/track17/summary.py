@@ -0,0 +1,112 @@
+from collections import Counter
+from collections.abc import Mapping
+from datetime import date
+from typing import Any, Dict, NamedTuple, Optional
+
+from homeassistant.util import dt as dt_util
+
+from .const import FINAL_STATUSES
+
+# Arrival key of packages out for delivery: arriving today whatever the date
+OUT_FOR_DELIVERY = "OutForDelivery"
+
+
+class SummaryKey(NamedTuple):
+    """What one package contributes to the summary counters."""
+
+    status: Optional[str]
+    carrier: Optional[str]
+    # OUT_FOR_DELIVERY, the ISO date of the estimated arrival, or None
+    arrival: Optional[str]
+
+
+def _arrival(payload: Mapping) -> Optional[str]:
+    status = payload.get("status")
+    if status == OUT_FOR_DELIVERY:
+        return OUT_FOR_DELIVERY
+    estimated = payload.get("estimatedDelivery")
+    if status in FINAL_STATUSES or not isinstance(estimated, str):
+        return None
+    parsed = dt_util.parse_datetime(estimated)
+    if parsed is not None:
+        return dt_util.as_local(parsed).date().isoformat()
+    parsed_date = dt_util.parse_date(estimated)
+    return parsed_date.isoformat() if parsed_date else None
+
+
+def summary_key(payload: Any) -> SummaryKey:
+    """Return the counters ``payload`` belongs to; errors count nowhere."""
+    if not isinstance(payload, Mapping) or "error" in payload:
+        return SummaryKey(None, None, None)
+    carrier = payload.get("carrier")
+    # Register replies carry a numeric 17TRACK code until the first poll
+    # resolves the provider name; only names are counted
+    if not isinstance(carrier, str) or not carrier or carrier.isdigit():
+        carrier = None
+    return SummaryKey(payload.get("status"), carrier, _arrival(payload))
+
+
+class PackageSummary:
+    """Package counts by status, by carrier and by expected arrival date.
+
+    The coordinator calls `update` for the packages whose payload changed
+    and `discard` for removed or archived ones, so keeping the counts
+    costs time proportional to the change, not to the number of packages.
+    """
+
+    def __init__(self):
+        self.statuses: Counter = Counter()
+        self.carriers: Counter = Counter()
+        self._arrivals: Counter = Counter()
+        self._keys: Dict[str, SummaryKey] = {}
+
+    def update(self, number: str, payload: Any) -> bool:
+        """Count ``number`` with its new payload; return whether counts changed."""
+        key = summary_key(payload)
+        previous = self._keys.get(number)
+        if key == previous:
+            return False
+        if previous is not None:
+            self._remove(previous)
+        self._keys[number] = key
+        self._add(self.statuses, key.status)
+        self._add(self.carriers, key.carrier)
+        self._add(self._arrivals, key.arrival)
+        return True
+
+    def discard(self, number: str) -> bool:
+        """Stop counting ``number``; return whether it was counted."""
+        key = self._keys.pop(number, None)
+        if key is None:
+            return False
+        self._remove(key)
+        return True
+
+    def arriving_today(self, today: Optional[date] = None) -> int:
+        """Packages out for delivery or estimated to arrive ``today``."""
+        today = today or dt_util.now().date()
+        return self._arrivals[OUT_FOR_DELIVERY] + self._arrivals[today.isoformat()]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "statuses": dict(self.statuses),
+            "carriers": dict(self.carriers),
+            "arriving_today": self.arriving_today(),
+        }
+
+    @staticmethod
+    def _add(counter: Counter, value: Optional[str]) -> None:
+        if value is not None:
+            counter[value] += 1
+
+    def _remove(self, key: SummaryKey) -> None:
+        for counter, value in (
+            (self.statuses, key.status),
+            (self.carriers, key.carrier),
+            (self._arrivals, key.arrival),
+        ):
+            if value is None:
+                continue
+            counter[value] -= 1
+            if counter[value] <= 0:
+                del counter[value]
@@ -0,0 +1,97 @@
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional
+
+from .const import TIMELINE_MAX_EVENTS
+
+
+def extract_events(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the tracking events of a payload, oldest first.
+
+    ``data`` is a raw 17TRACK item or a `PackageState`, which carries the
+    events already extracted under ``events``.
+    """
+    if "track_info" not in data:
+        return list(data.get("events") or ())
+    track_info = data.get("track_info") or {}
+    providers = (track_info.get("tracking") or {}).get("providers") or []
+    events: List[Dict[str, Any]] = []
+    for provider in providers:
+        for event in provider.get("events") or []:
+            if not isinstance(event, dict) or not event.get("time_iso"):
+                continue
+            events.append({
+                "time": event["time_iso"],
+                "description": event.get("description") or "",
+                "location": event.get("location"),
+                "stage": event.get("stage"),
+                "sub_status": event.get("sub_status"),
+            })
+    events.sort(key=lambda e: e["time"])
+    return events
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """Identify an event by its time and a short hash of its description."""
+    digest = hashlib.blake2b(event["description"].encode(), digest_size=4).hexdigest()
+    return f"{event['time']}|{digest}"
+
+
+class PackageTimeline:
+    """Append-only history of tracking events per package.
+
+    Only the compact fields of each event are kept, newest
+    `TIMELINE_MAX_EVENTS` per package. `merge` returns the events that were
+    not seen before, which is what drives the checkpoint event.
+    """
+
+    def __init__(self):
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._keys: Dict[str, set] = {}
+
+    def load(self, number: str, history: Iterable[Dict[str, Any]]) -> None:
+        """Restore a stored history for ``number``."""
+        events = [e for e in history if isinstance(e, dict) and e.get("time")]
+        self._events[number] = events
+        self._keys[number] = {event_key(e) for e in events}
+
+    def history(self, number: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the stored events for ``number`` or None if never merged."""
+        return self._events.get(number)
+
+    def merge(self, number: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Append new events from ``data`` and return them.
+
+        The first merge bringing events only seeds the history and returns
+        nothing, so adding a package does not replay its whole past, even
+        when its first data (the register reply) has no events. 17TRACK
+        sends the full history every time, so once the history is trimmed,
+        events no newer than the oldest one kept were seen and dropped.
+        """
+        first = not self._events.get(number)
+        events = self._events.setdefault(number, [])
+        keys = self._keys.setdefault(number, set())
+        floor = events[0]["time"] if len(events) >= TIMELINE_MAX_EVENTS else None
+
+        new_events = []
+        for event in extract_events(data):
+            key = event_key(event)
+            if key in keys or (floor is not None and event["time"] <= floor):
+                continue
+            keys.add(key)
+            events.append(event)
+            new_events.append(event)
+
+        if new_events:
+            events.sort(key=lambda e: e["time"])
+            if len(events) > TIMELINE_MAX_EVENTS:
+                dropped = events[:-TIMELINE_MAX_EVENTS]
+                del events[:-TIMELINE_MAX_EVENTS]
+                keys.difference_update(event_key(e) for e in dropped)
+        return [] if first else new_events
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Drop the history of every package not in ``keep``."""
+        keep = set(keep)
+        for number in [n for n in self._events if n not in keep]:
+            del self._events[number]
+            del self._keys[number]
@@ -0,0 +1,205 @@
+import asyncio
+import gzip
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple,
+)
+
+import aiohttp
+
+from .const import API_ERROR_NOT_REGISTERED
+
+RECORDING_VERSION = 1
+
+
+class TransportResponse(NamedTuple):
+    """What `Track17Api` needs from an HTTP response."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class Transport(ABC):
+    """Sends one POST request for `Track17Api`.
+
+    `AiohttpTransport` is the default. `RecordingTransport` and
+    `ReplayTransport` record real traffic and play it back, so refresh
+    cycles can be load tested and profiled offline (``benchmarks/replay.py``).
+
+    Implementations raise ``asyncio.TimeoutError`` or ``aiohttp.ClientError``
+    for transport failures, exactly like aiohttp, so retries and the
+    circuit breaker behave the same whatever the transport.
+    """
+
+    @abstractmethod
+    async def async_post(
+        self, url: str, payload: Any, headers: Mapping[str, str], timeout: aiohttp.ClientTimeout
+    ) -> TransportResponse:
+        """Send ``payload`` as JSON to ``url`` and return the response."""
+
+    async def async_close(self) -> None:
+        """Release resources held by the transport."""
+
+
+class AiohttpTransport(Transport):
+    """Send requests with the aiohttp session returned by ``get_session``."""
+
+    def __init__(self, get_session: Callable[[], Awaitable[aiohttp.ClientSession]]):
+        self._get_session = get_session
+
+    async def async_post(self, url, payload, headers, timeout) -> TransportResponse:
+        session = await self._get_session()
+        async with session.post(url, json=payload, headers=headers, timeout=timeout) as resp:
+            return TransportResponse(resp.status, resp.headers, await resp.read())
+
+
+class RecordingTransport(Transport):
+    """Pass requests to ``inner`` and record each exchange to ``path``.
+
+    Request headers (which carry the API key) are not recorded. The file is
+    written when the transport is closed.
+    """
+
+    def __init__(self, inner: Transport, path: str):
+        self.inner = inner
+        self.path = path
+        self.exchanges: List[Dict[str, Any]] = []
+        self._started = time.monotonic()
+
+    async def async_post(self, url, payload, headers, timeout) -> TransportResponse:
+        start = time.monotonic()
+        response = await self.inner.async_post(url, payload, headers, timeout)
+        self.exchanges.append({
+            "offset": round(start - self._started, 4),
+            "latency": round(time.monotonic() - start, 4),
+            "endpoint": url.rsplit("/", 1)[-1],
+            "request": payload,
+            "status": response.status,
+            "retry_after": response.headers.get("Retry-After"),
+            "body": response.body.decode("utf-8", errors="replace"),
+        })
+        return response
+
+    async def async_close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._write)
+        await self.inner.async_close()
+
+    def _write(self) -> None:
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.write(json.dumps({"version": RECORDING_VERSION}) + "\n")
+            for exchange in self.exchanges:
+                handle.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+
+
+def load_recording(path: str) -> List[Dict[str, Any]]:
+    """Return the exchanges of a recording written by `RecordingTransport`."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {header.get('version')}")
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+class ReplayTransport(Transport):
+    """Answer requests from recorded exchanges.
+
+    Each tracking number gets its last recorded ``accepted`` or ``rejected``
+    item, so requests may batch numbers differently than when recording.
+    A request waits the recorded latency of its first number divided by
+    ``speed``. Recorded failures (429, 5xx) are replayed once the replay
+    clock, also scaled by ``speed``, reaches their original offset.
+    Numbers handed out by `numbers` beyond the recorded ones are synthetic
+    copies of recorded packages, for load tests at larger package counts.
+    """
+
+    def __init__(self, exchanges: List[Dict[str, Any]], speed: float = 1.0):
+        self.speed = speed
+        # endpoint -> number -> (section, item, latency)
+        self._items: Dict[str, Dict[str, Tuple[str, Dict[str, Any], float]]] = {}
+        self._failures: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._quota: Optional[Tuple[bytes, float]] = None
+        self._aliases: Dict[str, str] = {}
+        self._started: Optional[float] = None
+        for exchange in exchanges:
+            self._index(exchange)
+
+    @classmethod
+    def from_file(cls, path: str, speed: float = 1.0) -> "ReplayTransport":
+        return cls(load_recording(path), speed)
+
+    def _index(self, exchange: Dict[str, Any]) -> None:
+        endpoint = exchange["endpoint"]
+        if exchange["status"] != 200:
+            self._failures.setdefault(endpoint, deque()).append(exchange)
+            return
+        body = exchange["body"].encode()
+        if endpoint == "getquota":
+            self._quota = (body, exchange["latency"])
+            return
+        data = (json.loads(body) or {}).get("data") or {}
+        items = self._items.setdefault(endpoint, {})
+        for section in ("accepted", "rejected"):
+            for item in data.get(section) or []:
+                if isinstance(item, dict) and item.get("number"):
+                    items[item["number"]] = (section, item, exchange["latency"])
+
+    @property
+    def recorded_numbers(self) -> List[str]:
+        """Numbers with a recorded ``gettrackinfo`` result."""
+        return list(self._items.get("gettrackinfo", {}))
+
+    def numbers(self, count: int) -> List[str]:
+        """Return ``count`` numbers to track: recorded ones, then synthetic."""
+        recorded = self.recorded_numbers
+        if not recorded:
+            raise ValueError("The recording has no gettrackinfo results")
+        numbers = recorded[:count]
+        for index in range(len(recorded), count):
+            synthetic = f"SYN{index:07d}"
+            self._aliases[synthetic] = recorded[index % len(recorded)]
+            numbers.append(synthetic)
+        return numbers
+
+    def _lookup(self, endpoint: str, number: str) -> Tuple[str, Dict[str, Any], float]:
+        items = self._items.get(endpoint, {})
+        found = items.get(number) or items.get(self._aliases.get(number, ""))
+        if found:
+            section, item, latency = found
+            return section, {**item, "number": number}, latency
+        if endpoint == "register":
+            return "accepted", {"number": number, "carrier": 0}, 0.0
+        error = {"code": API_ERROR_NOT_REGISTERED, "message": "Not registered"}
+        return "rejected", {"number": number, "error": error}, 0.0
+
+    async def async_post(self, url, payload, headers, timeout) -> TransportResponse:
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        endpoint = url.rsplit("/", 1)[-1]
+
+        failures = self._failures.get(endpoint)
+        if failures and (now - self._started) * self.speed >= failures[0]["offset"]:
+            failure = failures.popleft()
+            await asyncio.sleep(failure["latency"] / self.speed)
+            headers = {"Retry-After": failure["retry_after"]} if failure["retry_after"] else {}
+            return TransportResponse(failure["status"], headers, failure["body"].encode())
+
+        if endpoint == "getquota":
+            body, latency = self._quota or (b'{"code": 0, "data": {}}', 0.0)
+            await asyncio.sleep(latency / self.speed)
+            return TransportResponse(200, {}, body)
+
+        data: Dict[str, List[Dict[str, Any]]] = {"accepted": [], "rejected": []}
+        latency = None
+        for request in payload or []:
+            section, item, item_latency = self._lookup(endpoint, request.get("number"))
+            data[section].append(item)
+            if latency is None:
+                latency = item_latency
+        await asyncio.sleep((latency or 0.0) / self.speed)
+        body = json.dumps({"code": 0, "data": data}).encode()
+        return TransportResponse(200, {}, body)
@@ -0,0 +1,69 @@
+import hashlib
+import hmac
+import logging
+from typing import Any, Callable, Dict
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.network import NoURLAvailableError
+from homeassistant.util.json import json_loads
+
+from .models import PackageState
+from .const import DOMAIN, PUSH_EVENT_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def verify_signature(body: str, signature: str, api_key: str) -> bool:
+    """Check a 17TRACK push signature: sha256 of ``body + "/" + api_key``."""
+    expected = hashlib.sha256(f"{body}/{api_key}".encode()).hexdigest()
+    return hmac.compare_digest(expected, (signature or "").lower())
+
+
+async def async_handle_push_request(coordinator, request: web.Request) -> web.Response:
+    """Verify a pushed tracking update and feed it to the coordinator."""
+    body = await request.text()
+    if not verify_signature(body, request.headers.get("sign", ""), coordinator.api.api_key):
+        _LOGGER.warning("Rejected 17TRACK push with an invalid signature")
+        return web.Response(status=401)
+
+    try:
+        payload: Dict[str, Any] = json_loads(body)
+    except ValueError:
+        return web.Response(status=400)
+    if not isinstance(payload, dict):
+        return web.Response(status=400)
+
+    item = payload.get("data")
+    if payload.get("event") == PUSH_EVENT_UPDATED and isinstance(item, dict) and item.get("number"):
+        coordinator.async_handle_push(item["number"], PackageState.from_item(item))
+
+    # Anything else (e.g. TRACKING_STOPPED) is acknowledged so 17TRACK
+    # does not keep retrying it.
+    return web.Response(status=200)
+
+
+@callback
+def async_register_push(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> Callable[[], None]:
+    """Register the push webhook for ``entry`` and return an unregister callback.
+
+    The webhook id is generated once and kept in the entry data, so the URL
+    configured in the 17TRACK dashboard stays valid across restarts.
+    """
+    webhook_id = entry.data.get("webhook_id")
+    if not webhook_id:
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(entry, data={**entry.data, "webhook_id": webhook_id})
+
+    async def _async_handle(hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response:
+        return await async_handle_push_request(coordinator, request)
+
+    webhook.async_register(hass, DOMAIN, "17TRACK", webhook_id, _async_handle, allowed_methods=["POST"])
+    try:
+        url = webhook.async_generate_url(hass, webhook_id)
+    except NoURLAvailableError:
+        url = f"<external url>/api/webhook/{webhook_id}"
+    _LOGGER.info("17TRACK push mode enabled; set the webhook URL in the 17TRACK dashboard to %s", url)
+    return lambda: webhook.async_unregister(hass, webhook_id)
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.track17 import coordinator, sensor
+from custom_components.track17.const import DOMAIN
+
+
+@pytest.fixture
+def make_entry():
+    """Return a factory for MagicMock config entries."""
+
+    def _make(entry_id="test", api_key="abc", **options):
+        entry = MagicMock()
+        entry.entry_id = entry_id
+        entry.data = {"api_key": api_key}
+        entry.options = options
+        return entry
+
+    return _make
+
+
+@pytest.fixture
+def make_coordinator(monkeypatch, make_entry):
+    """Return a factory for coordinators on a MagicMock hass.
+
+    Storage is replaced by ``store`` (a MagicMock by default); ``options``
+    become the entry options.
+    """
+
+    def _make(hass=None, store=None, hub=None, entry_id="test", api_key="abc", **options):
+        store = store if store is not None else MagicMock()
+        monkeypatch.setattr(coordinator, "Track17Store", lambda *args: store)
+        entry = make_entry(entry_id, api_key, **options)
+        return coordinator.Track17Coordinator(hass or MagicMock(), entry, hub)
+
+    return _make
+
+
+@pytest.fixture
+def setup_sensors(monkeypatch):
+    """Return a coroutine that sets up the sensor platform for a coordinator.
+
+    Added entities get ``sensor.<unique_id>`` as entity id and an entry in a
+    MagicMock entity registry. The result exposes ``added`` (one list per
+    ``async_add_entities`` call), ``registry`` and ``update()``, which runs
+    the coordinator listeners.
+    """
+    registry = MagicMock()
+    monkeypatch.setattr(sensor.er, "async_get", lambda hass: registry)
+
+    async def _setup(coord):
+        hass = MagicMock()
+        hass.data = {DOMAIN: {coord.entry.entry_id: coord}}
+        listeners = []
+        coord.async_add_listener = lambda listener: listeners.append(listener) or MagicMock()
+        added = []
+
+        def add_entities(entities):
+            for entity in entities:
+                entity.entity_id = f"sensor.{entity.unique_id}"
+            added.append(list(entities))
+
+        await sensor.async_setup_entry(hass, coord.entry, add_entities)
+
+        def update():
+            for listener in listeners:
+                listener()
+
+        return SimpleNamespace(hass=hass, added=added, registry=registry, update=update)
+
+    return _setup
@@ -0,0 +1,55 @@
+import pytest
+
+from custom_components.track17 import api
+
+
+@pytest.mark.asyncio
+async def test_async_get_tracking_batch_chunks_and_maps_results():
+    client = api.Track17Api("abc")
+    calls = []
+
+    async def fake_post(endpoint, payload):
+        numbers = [item["number"] for item in payload]
+        calls.append(numbers)
+        accepted = [
+            {
+                "number": n,
+                "track_info": {
+                    "latest_status": {"status": "InTransit"},
+                    "latest_event": {"description": "Departed", "time_iso": "2024-01-01T00:00:00Z"},
+                },
+            }
+            for n in numbers
+            if n not in ("BAD", "GONE")
+        ]
+        rejected = [{"number": "BAD", "error": {"message": "Invalid number"}}] if "BAD" in numbers else []
+        return {"code": 0, "data": {"accepted": accepted, "rejected": rejected}}
+
+    client._async_post = fake_post
+
+    numbers = [f"LP{i}" for i in range(85)] + ["BAD", "GONE"]
+    results = await client.async_get_tracking_batch(numbers)
+
+    assert [len(c) for c in calls] == [40, 40, 7]
+    assert set(results) == set(numbers)
+    assert results["LP0"]["status"] == "InTransit"
+    assert results["LP0"]["lastEvent"] == "Departed"
+    assert results["BAD"] == {"error": "Invalid number"}
+    assert "error" in results["GONE"]
+
+
+@pytest.mark.asyncio
+async def test_async_get_tracking_batch_propagates_request_error():
+    client = api.Track17Api("abc")
+
+    async def fake_post(endpoint, payload):
+        return {"error": "API request timed out"}
+
+    client._async_post = fake_post
+
+    results = await client.async_get_tracking_batch(["LP1", "LP2"])
+
+    assert results == {
+        "LP1": {"error": "API request timed out"},
+        "LP2": {"error": "API request timed out"},
+    }
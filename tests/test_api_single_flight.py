@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from custom_components.track17 import api
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_request_then_hit_memory():
+    client = api.Track17Api("abc")
+    requested = []
+    release = asyncio.Event()
+
+    async def fake_fetch_chunk(endpoint, chunk, carriers=None):
+        requested.extend(chunk)
+        await release.wait()
+        return {n: {"status": "InTransit"} for n in chunk}
+
+    client._async_fetch_chunk = fake_fetch_chunk
+
+    first = asyncio.ensure_future(client.async_get_tracking_batch(["LP00001", "LP00002"]))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(client.async_get_tracking("LP00001"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == {"LP00001": {"status": "InTransit"}, "LP00002": {"status": "InTransit"}}
+    assert await second == {"status": "InTransit"}
+    assert requested == ["LP00001", "LP00002"]
+
+    # Within the freshness window results come from memory
+    assert await client.async_get_tracking("LP00002") == {"status": "InTransit"}
+    assert requested == ["LP00001", "LP00002"]
+    assert not client._inflight
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_but_not_remembered():
+    client = api.Track17Api("abc")
+    calls = []
+
+    async def fake_fetch_chunk(endpoint, chunk, carriers=None):
+        calls.append(chunk)
+        return {n: {"error": "HTTP 500"} for n in chunk}
+
+    client._async_fetch_chunk = fake_fetch_chunk
+
+    assert "error" in await client.async_get_tracking("LP00001")
+    assert "error" in await client.async_get_tracking("LP00001")
+    assert len(calls) == 2
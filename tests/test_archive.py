@@ -0,0 +1,56 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+
+def test_archive_moves_finished_packages_after_grace_period(make_coordinator):
+    coord = make_coordinator(archive_after_days=7)
+
+    now = dt_util.utcnow()
+    coord.tracking_numbers = ["OLD", "RECENT", "MOVING"]
+    coord.data = {
+        "OLD": {"status": "Delivered", "lastEventTime": (now - timedelta(days=8)).isoformat()},
+        "RECENT": {"status": "Delivered", "lastEventTime": (now - timedelta(days=1)).isoformat()},
+        "MOVING": {"status": "InTransit", "lastEventTime": (now - timedelta(days=30)).isoformat()},
+    }
+    coord._delivered_cache = {"OLD", "RECENT"}
+
+    assert coord._archive_finished(now) == ["OLD"]
+    assert coord.tracking_numbers == ["RECENT", "MOVING"]
+    assert coord.archive["OLD"]["status"] == "Delivered"
+
+    coord.data = coord._merge_results({})
+    saved = coord._data_to_save()
+    assert "OLD" not in coord.data
+    assert saved["delivered"] == ["RECENT", "OLD"]
+    assert "OLD" in saved["archive"]
+
+
+@pytest.mark.asyncio
+async def test_readded_archived_package_does_not_fire_delivered_again(make_coordinator):
+    class DummyStore:
+        async def async_load(self):
+            # Written before archived numbers kept the delivered flag
+            return {
+                "tracking_numbers": [],
+                "delivered": [],
+                "archive": {"OLD": {"status": "Delivered"}},
+                "registered": ["OLD"],
+            }
+
+        def async_schedule_save(self, data_func):
+            pass
+
+    hass = MagicMock()
+    coord = make_coordinator(hass, store=DummyStore())
+    await coord.async_load()
+    assert coord._data_to_save()["delivered"] == ["OLD"]
+
+    coord.tracking_numbers = ["OLD"]
+    coord.archive.pop("OLD")
+    coord.data = coord._merge_results({"OLD": {"status": "Delivered"}})
+
+    fired = [c.args[0] for c in hass.bus.async_fire.call_args_list]
+    assert "track17_delivered" not in fired
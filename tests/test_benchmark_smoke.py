@@ -0,0 +1,15 @@
+import pytest
+
+from benchmarks.bench_refresh import parse_args, run
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_cold_and_warm_cycles():
+    report = await run(parse_args(["--sizes", "45", "--latency", "0", "--rps", "100"]))
+
+    cold, warm = report["results"]
+    assert cold["cycle"] == "cold"
+    assert cold["requests_by_endpoint"]["gettrackinfo"] == 2
+    assert cold["numbers_requested"] == 45
+    assert warm["requests"] == 0
+    assert {"wall_s", "peak_mem_kb", "loop_block_max_ms"} <= cold.keys()
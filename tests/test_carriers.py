@@ -0,0 +1,19 @@
+from custom_components.track17.carriers import detect_carrier, validate_tracking_number
+
+
+def test_detects_carriers_from_number_format():
+    assert detect_carrier("1Z999AA10123456784") == ("UPS", 100002)
+    assert detect_carrier("rr123456785gb") == ("Royal Mail", 11031)
+    assert detect_carrier("EE123456785XX") == ("Postal service (XX)", None)
+    assert detect_carrier("LP00123456789012") is None
+
+
+def test_rejects_only_certain_mistakes():
+    assert validate_tracking_number("1Z999AA10123456784") is None
+    assert validate_tracking_number("1Z999AA10123456785") == "Invalid check digit for UPS"
+    assert validate_tracking_number("RR123456784GB") == "Invalid check digit for Royal Mail"
+    assert validate_tracking_number("LP 123") == "Invalid tracking number format"
+    assert validate_tracking_number("abc") == "Invalid tracking number format"
+    # Numeric formats are shared between carriers: a failed check is not an error
+    assert validate_tracking_number("9400000000000000000001") is None
+    assert validate_tracking_number("LP00123456789012") is None
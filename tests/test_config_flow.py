@@ -0,0 +1,26 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.track17.config_flow import Track17ConfigFlow, Track17OptionsFlow
+
+
+@pytest.mark.asyncio
+async def test_options_flow_shows_current_options_and_saves_changes():
+    entry = MagicMock()
+    entry.options = {"scan_interval": 12, "push_mode": True}
+    flow = Track17ConfigFlow.async_get_options_flow(entry)
+    assert isinstance(flow, Track17OptionsFlow)
+
+    form = await flow.async_step_init()
+    defaults = {str(key): key.default() for key in form["data_schema"].schema}
+    assert defaults["scan_interval"] == 12
+    assert defaults["push_mode"] is True
+    assert defaults["max_concurrency"] == 8
+
+    options = form["data_schema"]({"scan_interval": 6, "max_concurrency": 4})
+    result = await flow.async_step_init(options)
+    assert result["type"] == "create_entry"
+    assert result["data"]["scan_interval"] == 6
+    assert result["data"]["max_concurrency"] == 4
+    assert result["data"]["push_mode"] is True
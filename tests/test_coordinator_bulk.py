@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_async_add_packages_validates_then_batches(make_coordinator):
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    coord = make_coordinator(store=store)
+    coord.tracking_numbers = ["OLD"]
+    coord.data = {}
+    coord._registered = {"LP00003"}
+
+    coord.api = MagicMock()
+    coord.api.async_register_batch = AsyncMock(
+        return_value={
+            "LP00001": {"carrier": 3011},
+            "LP00002": {"already_registered": True},
+            "RR123456785GB": {"carrier": 11031},
+            "BADNUMBER": {"error": "Invalid number"},
+        }
+    )
+    coord.api.async_get_tracking_batch = AsyncMock(
+        return_value={"LP00002": {"error": "Not found"}, "LP00003": {"status": "InTransit"}}
+    )
+
+    results = await coord.async_add_packages(
+        ["LP00001", "LP00002", "BADNUMBER", "OLD", "{{ states('input_text.x') }}", "LP00001", "LP00003",
+         "RR123456785GB", "RR123456784GB"]
+    )
+
+    assert results["LP00001"] == {"success": True}
+    assert results["LP00002"] == {"success": False, "error": "Not found"}
+    assert results["LP00003"] == {"success": True}
+    assert results["RR123456785GB"] == {"success": True, "carrier": "Royal Mail"}
+    assert results["RR123456784GB"] == {"success": False, "error": "Invalid check digit for Royal Mail"}
+    assert results["BADNUMBER"] == {"success": False, "error": "Invalid number"}
+    assert results["OLD"]["success"] is False
+    assert results["{{ states('input_text.x') }}"]["success"] is False
+    # LP00003 was registered before, so it skips the register call; the
+    # mistyped S10 number never reaches the API
+    coord.api.async_register_batch.assert_awaited_once_with(
+        ["LP00001", "LP00002", "BADNUMBER", "RR123456785GB"], {"RR123456785GB": 11031}
+    )
+    # Only previously registered numbers are fetched; LP00001 uses its register reply
+    coord.api.async_get_tracking_batch.assert_awaited_once_with(["LP00003", "LP00002"])
+    assert coord.tracking_numbers == ["OLD", "LP00001", "LP00003", "RR123456785GB"]
+    assert coord.data == {
+        "LP00001": {"carrier": 3011},
+        "LP00003": {"status": "InTransit"},
+        "RR123456785GB": {"carrier": "Royal Mail"},
+    }
+    assert coord.scheduler.next_due("LP00001") is not None
+    assert coord._data_to_save()["registered"] == ["LP00001", "LP00003", "RR123456785GB"]
+    store.async_schedule_save.assert_called_with(coord._data_to_save)
+    store.async_save.assert_not_awaited()
+    saved = coord._data_to_save()["packages"]
+    assert saved["LP00001"]["meta"]["added_at"] == saved["LP00003"]["meta"]["added_at"]
+
+
+@pytest.mark.asyncio
+async def test_async_add_package_costs_one_call(make_coordinator):
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    coord = make_coordinator(store=store)
+    coord.data = {}
+
+    coord.api = MagicMock()
+    coord.api.async_register_batch = AsyncMock(return_value={"LP00001": {"carrier": 3011}})
+    coord.api.async_get_tracking_batch = AsyncMock(return_value={"LP00001": {"status": "InfoReceived"}})
+
+    assert await coord.async_add_package("LP00001") is True
+    coord.api.async_register_batch.assert_awaited_once()
+    coord.api.async_get_tracking_batch.assert_not_awaited()
+
+    await coord.async_remove_package("LP00001")
+    assert await coord.async_add_package("LP00001") is True
+    coord.api.async_register_batch.assert_awaited_once()
+    coord.api.async_get_tracking_batch.assert_awaited_once()
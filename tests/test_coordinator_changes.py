@@ -0,0 +1,33 @@
+def test_merge_results_only_marks_changed_packages(make_coordinator):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP1", "LP2"]
+
+    coord.data = coord._merge_results({
+        "LP1": {"status": "InTransit", "lastEvent": "Departed"},
+        "LP2": {"status": "InTransit", "lastEvent": "Arrived"},
+    })
+    assert coord.changed_numbers == {"LP1", "LP2"}
+
+    first = coord.data
+    coord.data = coord._merge_results({
+        "LP1": {"status": "InTransit", "lastEvent": "Departed"},
+        "LP2": {"status": "InTransit", "lastEvent": "Out for delivery"},
+    })
+    assert coord.changed_numbers == {"LP2"}
+    assert coord.data["LP1"] is first["LP1"]
+
+    unchanged = coord.data
+    result = coord._merge_results({"LP1": {"status": "InTransit", "lastEvent": "Departed"}})
+    assert coord.changed_numbers == set()
+    assert result is unchanged
+
+
+def test_merge_results_keeps_previous_data_on_error(make_coordinator):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP1"]
+
+    coord.data = coord._merge_results({"LP1": {"status": "InTransit"}})
+    coord.data = coord._merge_results({"LP1": {"error": "API request timed out"}})
+
+    assert coord.data == {"LP1": {"status": "InTransit"}}
+    assert coord.changed_numbers == set()
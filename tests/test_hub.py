@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+from custom_components.track17 import hub
+
+
+def test_hub_shares_client_and_fetched_results(monkeypatch, make_coordinator):
+    monkeypatch.setattr(hub, "async_get_clientsession", lambda hass: MagicMock())
+    hass = MagicMock()
+    track17_hub = hub.Track17Hub(hass)
+
+    first = make_coordinator(hass, hub=track17_hub, entry_id="one")
+    second = make_coordinator(hass, hub=track17_hub, entry_id="two")
+    other_key = make_coordinator(hass, hub=track17_hub, entry_id="three", api_key="xyz")
+    for entry_id, coord in (("one", first), ("two", second), ("three", other_key)):
+        coord.tracking_numbers = ["LP00001"]
+        coord.data = {}
+        coord.async_update_listeners = MagicMock()
+        track17_hub.add_coordinator(entry_id, coord)
+
+    assert first.api is second.api
+    assert other_key.api is not first.api
+
+    batch = {"LP00001": {"status": "InTransit"}, "LP00002": {"status": "Delivered"}}
+    track17_hub.share(first, batch)
+
+    # Only the other entry on the same key receives the result it tracks
+    assert second.data == {"LP00001": {"status": "InTransit"}}
+    assert second.scheduler.next_due("LP00001") is not None
+    assert other_key.data == {}
+    assert first.data == {}
+    assert track17_hub.coordinators_for("LP00001") == [first, second, other_key]
+
+    track17_hub.remove_coordinator("one")
+    assert track17_hub.get_api("abc") is second.api
+    track17_hub.remove_coordinator("two")
+    assert track17_hub.get_api("abc") is not second.api
+
+
+def test_concurrency_bounds_come_from_the_first_entry_on_a_key(monkeypatch, make_coordinator):
+    monkeypatch.setattr(hub, "async_get_clientsession", lambda hass: MagicMock())
+    track17_hub = hub.Track17Hub(MagicMock())
+
+    first = make_coordinator(hub=track17_hub, entry_id="one", max_concurrency=3)
+    second = make_coordinator(hub=track17_hub, entry_id="two", max_concurrency=6)
+
+    assert first.api is second.api
+    assert first.api.concurrency.max_limit == 3
+    assert first.cycle_metrics is not second.cycle_metrics
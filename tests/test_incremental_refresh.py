@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from custom_components.track17 import api, coordinator
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_yields_fast_chunks_and_abandons_hung_one():
+    client = api.Track17Api("abc")
+
+    async def fake_fetch_chunk(endpoint, chunk, carriers=None):
+        if "HUNG" in chunk:
+            await asyncio.sleep(10)
+        return {n: {"status": "InTransit"} for n in chunk}
+
+    client._async_fetch_chunk = fake_fetch_chunk
+    numbers = [f"LP{i}" for i in range(40)] + ["HUNG"]
+
+    chunks = [c async for c in client.async_iter_batches("gettrackinfo", numbers, chunk_timeout=0.05)]
+
+    assert chunks[0] == {f"LP{i}": {"status": "InTransit"} for i in range(40)}
+    assert chunks[1] == {"HUNG": {"error": "API request timed out"}}
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_publishes_during_cycle(make_coordinator):
+    coord = make_coordinator(incremental_refresh=True)
+    coord.tracking_numbers = ["FAST", "NEXT", "SLOW"]
+    coord._registered = {"FAST", "NEXT", "SLOW"}
+    coord.data = {}
+    published = []
+    coord.async_update_listeners = lambda: published.append(dict(coord.data))
+    seen_before_slow = []
+
+    async def fake_iter(endpoint, numbers):
+        yield {"FAST": {"status": "InTransit"}}
+        await asyncio.sleep(0.05)
+        # Within STREAM_FLUSH_INTERVAL of the first publish: held back
+        yield {"NEXT": {"status": "InTransit"}}
+        await asyncio.sleep(coordinator.STREAM_FLUSH_INTERVAL + 0.2)
+        seen_before_slow.extend(published)
+        yield {"SLOW": {"status": "Delivered"}}
+
+    coord.api.async_iter_batches = fake_iter
+
+    async def no_quota():
+        return {"error": "skipped"}
+
+    coord.api.async_get_quota = no_quota
+
+    data = await coord._async_update_data()
+
+    # FAST right away, NEXT once the interval passed, both before SLOW
+    assert seen_before_slow == [
+        {"FAST": {"status": "InTransit"}},
+        {"FAST": {"status": "InTransit"}, "NEXT": {"status": "InTransit"}},
+    ]
+    assert data == {
+        "FAST": {"status": "InTransit"},
+        "NEXT": {"status": "InTransit"},
+        "SLOW": {"status": "Delivered"},
+    }
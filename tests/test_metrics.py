@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from custom_components.track17.metrics import ApiMetrics, CycleMetrics
+
+
+def test_metrics_track_latency_errors_and_cycles():
+    metrics = ApiMetrics()
+    cycle = CycleMetrics()
+    notified = []
+    metrics.add_listener(lambda: notified.append("api"))
+    cycle.add_listener(lambda: notified.append("cycle"))
+
+    cycle.start()
+    for ms in range(1, 101):
+        metrics.record_request(ms / 1000)
+    metrics.record_request(0.5, "API request timed out")
+    metrics.record_request(0.1, "Rate limited")
+    metrics.record_request(0.1, "HTTP 503")
+    cycle.end(packages=120)
+    metrics.record_request(0.1)
+
+    percentiles = metrics.latency_percentiles()
+    assert 50.0 <= percentiles["p50"] <= 53.0
+    assert percentiles["p99"] >= 100.0
+    assert metrics.errors == {"timeout": 1, "rate_limited": 1, "server_error": 1}
+    assert cycle.last_cycle["requests"] == 103
+    assert cycle.last_cycle["packages"] == 120
+    assert notified == ["cycle"]
+
+    metrics.update_quota({"quota_total": 100, "quota_remain": 40})
+    assert metrics.as_dict()["quota"]["quota_remain"] == 40
+    assert notified == ["cycle", "api"]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_cycles_on_a_shared_client_count_their_own_requests():
+    metrics = ApiMetrics()
+    first, second = CycleMetrics(), CycleMetrics()
+
+    async def send():
+        await asyncio.sleep(0)
+        metrics.record_request(0.01)
+
+    async def refresh(cycle, requests):
+        cycle.start()
+        # Requests run in tasks of their own, as batches do
+        await asyncio.gather(*(send() for _ in range(requests)))
+        cycle.end(packages=requests)
+
+    await asyncio.gather(refresh(first, 3), refresh(second, 5))
+
+    assert first.last_cycle["requests"] == 3
+    assert second.last_cycle["requests"] == 5
+    assert metrics.requests_total == 8
@@ -0,0 +1,44 @@
+from custom_components.track17.models import PackageState
+from custom_components.track17.timeline import extract_events
+
+
+ITEM = {
+    "number": "LP00001",
+    "carrier": 3011,
+    "track_info": {
+        "latest_status": {"status": "Delivered", "sub_status": "Delivered_Other"},
+        "latest_event": {"time_iso": "2024-01-02T10:00:00Z", "description": "Delivered"},
+        "shipping_info": {"recipient_address": {"country": "DE"}},
+        "time_metrics": {"estimated_delivery_date": {"from": "2024-01-01", "to": "2024-01-03"}},
+        "tracking": {"providers": [{
+            "provider": {"name": "China Post"},
+            "events": [
+                {"time_iso": "2024-01-01T08:00:00Z", "description": "Accepted"},
+                {"time_iso": "2024-01-02T10:00:00Z", "description": "Delivered"},
+            ],
+        }]},
+    },
+}
+
+
+def test_projects_item_into_flat_read_only_record():
+    state = PackageState.from_item(ITEM)
+
+    assert not hasattr(state, "__dict__")
+    assert state["status"] == "Delivered"
+    assert state.get("carrier") == "China Post"
+    assert state.get("deliveredAt") == "2024-01-02T10:00:00Z"
+    assert state.get("estimatedDelivery") == "2024-01-03"
+    assert "track_info" not in state and "error" not in state
+    assert [e["description"] for e in extract_events(state)] == ["Accepted", "Delivered"]
+    assert state.get("country") == "DE"
+
+
+def test_round_trips_through_flat_dict_and_legacy_cache():
+    state = PackageState.from_item(ITEM)
+
+    assert PackageState.from_dict(dict(state)) == state
+    # Payloads cached before records existed still carry the raw item
+    assert PackageState.from_dict({**ITEM, "status": "Delivered"}) == state
+    assert PackageState.from_dict({"status": "InTransit"}) == {"status": "InTransit"}
+    assert state.replace(carrier="Royal Mail")["carrier"] == "Royal Mail"
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.track17 import _async_migrate_unique_ids, button
+
+
+@pytest.mark.asyncio
+async def test_two_entries_get_distinct_unique_ids(make_coordinator, setup_sensors):
+    unique_ids = []
+    for entry_id in ("one", "two"):
+        # Both entries track the same number
+        coord = make_coordinator(entry_id=entry_id)
+        coord.tracking_numbers = ["LP00001"]
+        coord.data = coord._merge_results({"LP00001": {"status": "InTransit", "carrier": "USPS"}})
+        platform = await setup_sensors(coord)
+        unique_ids += [e.unique_id for batch in platform.added for e in batch]
+
+        buttons = []
+        await button.async_setup_entry(platform.hass, coord.entry, buttons.extend)
+        unique_ids += [b.unique_id for b in buttons]
+
+    assert len(unique_ids) == len(set(unique_ids))
+    assert "track17_one_LP00001" in unique_ids and "track17_two_LP00001" in unique_ids
+    assert "track17_two_refresh_button" in unique_ids
+
+
+@pytest.mark.asyncio
+async def test_existing_unique_ids_are_migrated_to_the_entry(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    try:
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        entry = MagicMock(entry_id="one")
+        for unique_id in ("track17_packages", "track17_LP00001", "track17_one_arriving_today"):
+            registry.async_get_or_create("sensor", "track17", unique_id, config_entry=entry)
+        package = registry.async_get_entity_id("sensor", "track17", "track17_LP00001")
+
+        await _async_migrate_unique_ids(hass, entry)
+
+        assert registry.async_get_entity_id("sensor", "track17", "track17_one_LP00001") == package
+        assert registry.async_get_entity_id("sensor", "track17", "track17_one_packages")
+        assert registry.async_get_entity_id("sensor", "track17", "track17_one_arriving_today")
+        assert registry.async_get_entity_id("sensor", "track17", "track17_packages") is None
+    finally:
+        await hass.async_stop(force=True)
@@ -0,0 +1,37 @@
+import pytest
+
+from custom_components.track17.sensor import Track17PackageSensor
+
+
+@pytest.mark.asyncio
+async def test_package_sensors_follow_tracked_numbers(make_coordinator, setup_sensors):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP00001"]
+    coord.data = {}
+    platform = await setup_sensors(coord)
+
+    sensors = [e for e in platform.added[-1] if isinstance(e, Track17PackageSensor)]
+    assert [s.tracking_number for s in sensors] == ["LP00001"]
+
+    # Adding a package only adds its own sensor
+    coord.tracking_numbers.append("LP00002")
+    platform.update()
+    assert [s.tracking_number for s in platform.added[-1]] == ["LP00002"]
+
+    # Removing one deletes its registry entry and adds nothing
+    calls = len(platform.added)
+    coord.tracking_numbers.remove("LP00001")
+    platform.update()
+    platform.registry.async_remove.assert_called_once_with("sensor.track17_test_LP00001")
+    assert len(platform.added) == calls
+
+    # Nothing changed: no entity calls at all
+    platform.update()
+    assert len(platform.added) == calls
+    platform.registry.async_remove.assert_called_once()
+
+    # Re-adding brings back a fresh sensor
+    coord.tracking_numbers.append("LP00001")
+    platform.update()
+    assert [s.tracking_number for s in platform.added[-1]] == ["LP00001"]
+    assert platform.added[-1][0] is not sensors[0]
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+from custom_components.track17.quota import QuotaBudget
+from custom_components.track17.scheduler import PackageScheduler
+
+NOW = datetime(2024, 1, 10, 12, 0, tzinfo=timezone.utc)
+TICK = timedelta(minutes=15)
+
+
+def test_budget_spreads_remaining_quota_and_shrinks_with_usage():
+    quota = QuotaBudget()
+    assert quota.budget(NOW, TICK) is None
+
+    # 30 days of 960 usable numbers -> 32 per day over the 48 ticks left today
+    quota.update({"quota_total": 1000, "quota_remain": 1010})
+    assert quota.budget(NOW, TICK) == 1
+
+    quota = QuotaBudget()
+    quota.update({"quota_total": 100000, "quota_remain": 100000})
+    first = quota.budget(NOW, TICK)
+    quota.record_usage(first * 20)
+    assert quota.budget(NOW + TICK, TICK) < first
+
+    # A fresh read showing the quota nearly gone lowers the day's allowance
+    quota.update({"quota_total": 100000, "quota_remain": 5000})
+    assert quota.budget(NOW + 2 * TICK, TICK) == 0
+
+
+def test_quota_reads_do_not_restart_the_day():
+    quota = QuotaBudget()
+    remain = 3000
+    start = NOW.replace(hour=0)
+    spent = 0
+    # One day of ticks with the quota read hourly, every package always due
+    for index in range(96):
+        now = start + index * TICK
+        if index % 4 == 0:
+            quota.update({"quota_total": 3000, "quota_remain": remain})
+        granted = quota.acquire(now, TICK, 1000)
+        quota.record_usage(granted)
+        remain -= granted
+        spent += granted
+
+    # 2850 usable numbers over 30 days
+    assert 90 <= spent <= 95
+
+
+def test_entries_sharing_a_client_share_each_tick_budget():
+    quota = QuotaBudget()
+    quota.update({"quota_total": 100000, "quota_remain": 100000})
+    budget = quota.budget(NOW, TICK)
+
+    first = quota.acquire(NOW, TICK, budget - 1)
+    second = quota.acquire(NOW + TICK / 2, TICK, 1000)
+    assert first + second == budget
+    assert quota.acquire(NOW + TICK / 2, TICK, 1000) == 0
+    assert quota.acquire(NOW + TICK, TICK, 1000) > 0
+
+
+def test_daily_limit_caps_budget():
+    quota = QuotaBudget()
+    quota.update({
+        "quota_total": 10_000_000,
+        "quota_remain": 10_000_000,
+        "max_track_daily": 100,
+        "today_used": 100,
+    })
+    assert quota.budget(NOW, TICK) == 0
+
+
+def test_prioritize_prefers_active_and_long_overdue_packages():
+    scheduler = PackageScheduler(timedelta(hours=24))
+    data = {
+        "STALE": {"status": "InTransit", "lastEventTime": (NOW - timedelta(days=9)).isoformat()},
+        "FRESH": {"status": "InTransit", "lastEventTime": (NOW - timedelta(hours=3)).isoformat()},
+        "OUT": {"status": "OutForDelivery", "lastEventTime": (NOW - timedelta(days=2)).isoformat()},
+    }
+    for number, payload in data.items():
+        scheduler.record(number, payload, NOW - timedelta(days=1))
+
+    order = scheduler.prioritize(["STALE", "FRESH", "OUT", "NEW"], data, NOW)
+
+    assert order[:2] == ["OUT", "NEW"]
+    assert order.index("FRESH") < order.index("STALE")
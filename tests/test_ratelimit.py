@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+
+from custom_components.track17 import api
+from custom_components.track17.ratelimit import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    AdaptiveConcurrency,
+    CircuitBreaker,
+    TokenBucket,
+)
+
+
+def test_circuit_breaker_opens_after_threshold_and_recovers():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    changes = []
+    breaker.add_listener(lambda: changes.append(breaker.state))
+
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow()
+
+    breaker.opened_at -= 61
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert changes == [CIRCUIT_OPEN, CIRCUIT_CLOSED]
+
+
+@pytest.mark.asyncio
+async def test_async_post_retries_with_retry_after(monkeypatch):
+    client = api.Track17Api("abc")
+    replies = [
+        ({"error": "Rate limited"}, True, 7.0),
+        ({"code": 0, "data": {}}, False, None),
+    ]
+    sleeps = []
+
+    async def fake_post_once(endpoint, payload):
+        return replies.pop(0)
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    client._async_post_once = fake_post_once
+    monkeypatch.setattr(api.asyncio, "sleep", fake_sleep)
+
+    data = await client._async_post("gettrackinfo", [])
+
+    assert data == {"code": 0, "data": {}}
+    assert sleeps == [7.0]
+    assert client.breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_async_post_skips_requests_while_circuit_open(monkeypatch):
+    client = api.Track17Api("abc")
+    client.rate_limiter = TokenBucket(rate=1000, capacity=1000)
+    calls = []
+
+    async def fake_post_once(endpoint, payload):
+        calls.append(endpoint)
+        return {"error": "API request timed out"}, True, None
+
+    async def fake_sleep(delay):
+        pass
+
+    client._async_post_once = fake_post_once
+    monkeypatch.setattr(api.asyncio, "sleep", fake_sleep)
+
+    for _ in range(api.CIRCUIT_FAILURE_THRESHOLD):
+        await client._async_post("gettrackinfo", [])
+    calls.clear()
+
+    assert await client._async_post("gettrackinfo", []) == {"error": "Circuit breaker open"}
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_grows_and_backs_off():
+    limiter = AdaptiveConcurrency(1, 4, start=2, latency_target=1.0)
+
+    for _ in range(10):
+        limiter.record(time.monotonic(), 0.1, overloaded=False)
+    assert limiter.limit == 4
+
+    # A burst of failures from requests started before the first decrease
+    # only halves once
+    started = time.monotonic()
+    limiter.record(started, 0.1, overloaded=True)
+    limiter.record(started, 0.1, overloaded=True)
+    assert limiter.limit == 2
+
+    # Slow successes hold the limit
+    limiter.record(time.monotonic(), 5.0, overloaded=False)
+    assert limiter.limit == 2
+
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await limiter.release()
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 2
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta, timezone
+
+from custom_components.track17.scheduler import PackageScheduler, compute_poll_interval
+
+NOW = datetime(2024, 1, 10, 12, 0, tzinfo=timezone.utc)
+MAX = timedelta(hours=24)
+
+
+def _data(status, age):
+    return {"status": status, "lastEventTime": (NOW - age).isoformat()}
+
+
+def test_compute_poll_interval_by_status_and_age():
+    assert compute_poll_interval(_data("Delivered", timedelta(hours=1)), NOW, MAX) is None
+    assert compute_poll_interval(_data("Expired", timedelta(days=30)), NOW, MAX) is None
+
+    fresh = compute_poll_interval(_data("InTransit", timedelta(hours=1)), NOW, MAX)
+    recent = compute_poll_interval(_data("InTransit", timedelta(hours=16)), NOW, MAX)
+    stale = compute_poll_interval(_data("InTransit", timedelta(days=10)), NOW, MAX)
+
+    assert fresh == timedelta(minutes=30)
+    assert recent == timedelta(hours=4)
+    assert stale == MAX
+    assert compute_poll_interval({"error": "boom"}, NOW, MAX) == timedelta(hours=1)
+
+
+def test_scheduler_only_returns_due_packages():
+    scheduler = PackageScheduler(MAX)
+    numbers = ["NEW", "DONE", "MOVING"]
+
+    scheduler.record("DONE", _data("Delivered", timedelta(hours=2)), NOW)
+    scheduler.record("MOVING", _data("InTransit", timedelta(hours=2)), NOW)
+
+    assert scheduler.due(numbers, NOW) == ["NEW"]
+    assert scheduler.due(numbers, NOW + timedelta(hours=1)) == ["NEW", "MOVING"]
+
+    assert "DONE" not in scheduler.due(numbers, NOW + timedelta(days=30))
@@ -0,0 +1,112 @@
+from datetime import timedelta
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.track17.storage import Track17Store
+
+
+@pytest.mark.asyncio
+async def test_migrate_v1_list_to_v2():
+    store = Track17Store.__new__(Track17Store)
+
+    migrated = await store._async_migrate_func(1, 1, ["LP1", "LP2"])
+
+    assert migrated == {
+        "tracking_numbers": ["LP1", "LP2"],
+        "packages": {},
+        "delivered": [],
+        "archive": {},
+        "registered": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_load_seeds_data_from_cache(make_coordinator):
+    now = dt_util.utcnow()
+    stored = {
+        "tracking_numbers": ["FRESH", "STALE", "NOCACHE"],
+        "packages": {
+            "FRESH": {"data": {"status": "Delivered"}, "fetched_at": now.isoformat()},
+            "STALE": {
+                "data": {"status": "InTransit"},
+                "fetched_at": (now - timedelta(days=2)).isoformat(),
+            },
+        },
+    }
+
+    class DummyStore:
+        async def async_load(self):
+            return stored
+
+    coord = make_coordinator(store=DummyStore())
+
+    await coord.async_load()
+
+    assert coord.data == {"FRESH": {"status": "Delivered"}, "STALE": {"status": "InTransit"}}
+    assert coord.scheduler.due(coord.tracking_numbers, now) == ["STALE", "NOCACHE"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_payload_after_restart_is_not_a_change(make_coordinator):
+    item = {
+        "number": "LP00001",
+        "track_info": {
+            "latest_status": {"status": "InTransit"},
+            "latest_event": {"time_iso": "2024-01-02T10:00:00Z", "description": "Departed"},
+            "tracking": {"providers": [{"events": [
+                {"time_iso": "2024-01-01T08:00:00Z", "description": "Accepted"},
+                {"time_iso": "2024-01-02T10:00:00Z", "description": "Departed"},
+            ]}]},
+        },
+    }
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP00001"]
+    coord.data = coord._merge_results({"LP00001": item})
+    # Events live in the timeline only
+    assert "events" not in coord.data["LP00001"]
+    stored = json.loads(json.dumps(coord._data_to_save()))
+
+    class DummyStore:
+        async def async_load(self):
+            return stored
+
+        def async_schedule_save(self, data_func):
+            pass
+
+    restarted = make_coordinator(store=DummyStore())
+    await restarted.async_load()
+    restarted.data = restarted._merge_results({"LP00001": item})
+
+    assert restarted.changed_numbers == set()
+
+
+@pytest.mark.asyncio
+async def test_schedule_save_coalesces_a_burst_into_one_write():
+    store = Track17Store.__new__(Track17Store)
+    store._dirty = False
+    store._data_func = None
+    store.async_delay_save = MagicMock()
+    writes = []
+
+    async def async_save(data):
+        writes.append(data)
+
+    store.async_save = async_save
+    state = {"tracking_numbers": ["LP00001"]}
+
+    store.async_schedule_save(lambda: dict(state))
+    state["tracking_numbers"] = ["LP00001", "LP00002"]
+    store.async_schedule_save(lambda: dict(state))
+
+    # Only the first change of the burst schedules the delayed write
+    store.async_delay_save.assert_called_once()
+    assert store.dirty
+
+    await store.async_flush()
+    assert writes == [{"tracking_numbers": ["LP00001", "LP00002"]}]
+    assert not store.dirty
+    await store.async_flush()
+    assert len(writes) == 1
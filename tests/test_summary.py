@@ -0,0 +1,101 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.track17.models import PackageState
+from custom_components.track17.summary import PackageSummary
+
+
+def test_summary_moves_counts_between_keys():
+    summary = PackageSummary()
+    today = date(2024, 1, 5)
+
+    assert summary.update("LP00001", {"status": "InTransit", "carrier": "China Post",
+                                      "estimatedDelivery": "2024-01-05"})
+    assert summary.update("LP00002", {"status": "InTransit", "carrier": "USPS"})
+    assert not summary.update("LP00002", {"status": "InTransit", "carrier": "USPS"})
+    assert summary.statuses == {"InTransit": 2}
+    assert summary.arriving_today(today) == 1
+
+    summary.update("LP00002", {"status": "OutForDelivery", "carrier": "USPS"})
+    summary.update("LP00001", {"status": "Delivered", "carrier": "China Post",
+                               "estimatedDelivery": "2024-01-05"})
+    assert summary.statuses == {"OutForDelivery": 1, "Delivered": 1}
+    assert summary.arriving_today(today) == 1
+
+    assert summary.discard("LP00002")
+    assert not summary.discard("LP00002")
+    assert summary.carriers == {"China Post": 1}
+    assert summary.arriving_today(today) == 0
+
+
+def test_coordinator_counts_only_changed_packages(make_coordinator, monkeypatch):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP00001", "LP00002"]
+    coord.data = coord._merge_results({
+        "LP00001": {"status": "InTransit", "carrier": "USPS"},
+        "LP00002": {"error": "API request timed out"},
+    })
+    assert coord.summary.statuses == {"InTransit": 1}
+
+    update = MagicMock(wraps=coord.summary.update)
+    monkeypatch.setattr(coord.summary, "update", update)
+    coord.data = coord._merge_results({
+        "LP00001": {"status": "InTransit", "carrier": "USPS"},
+        "LP00002": PackageState(number="LP00002", status="Delivered", carrier="USPS"),
+    })
+    update.assert_called_once()
+    assert coord.summary.statuses == {"InTransit": 1, "Delivered": 1}
+    assert coord.summary.carriers == {"USPS": 2}
+
+
+@pytest.mark.asyncio
+async def test_removed_packages_leave_the_summary(make_coordinator):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP00001", "LP00002"]
+    coord.data = coord._merge_results({
+        "LP00001": {"status": "InTransit", "carrier": "USPS"},
+        "LP00002": {"status": "InTransit", "carrier": "UPS"},
+    })
+    coord._async_publish = MagicMock()
+    await coord.async_remove_packages(["LP00002"])
+
+    assert coord.summary.statuses == {"InTransit": 1}
+    assert coord.summary.carriers == {"USPS": 1}
+
+
+def test_numeric_carrier_codes_are_not_counted():
+    summary = PackageSummary()
+
+    summary.update("LP00001", {"carrier": 3011})
+    summary.update("LP00002", {"carrier": "3011"})
+    assert summary.carriers == {}
+    summary.update("LP00001", {"status": "InTransit", "carrier": "China Post"})
+    assert summary.carriers == {"China Post": 1}
+
+
+@pytest.mark.asyncio
+async def test_carrier_sensors_stay_until_a_package_is_removed(make_coordinator, setup_sensors):
+    coord = make_coordinator()
+    coord.tracking_numbers = ["LP00001", "LP00002"]
+    coord.data = coord._merge_results({
+        "LP00001": {"status": "InTransit", "carrier": "USPS"},
+        "LP00002": {"status": "InTransit", "carrier": "UPS"},
+    })
+    platform = await setup_sensors(coord)
+    carriers = [e.unique_id for batch in platform.added for e in batch if "_carrier_" in e.unique_id]
+    assert sorted(carriers) == ["track17_test_carrier_ups", "track17_test_carrier_usps"]
+
+    # UPS drops to 0 through a data change: its sensor stays
+    coord.data = coord._merge_results({"LP00002": {"status": "InTransit", "carrier": "DHL"}})
+    platform.update()
+    platform.registry.async_remove.assert_not_called()
+
+    # Once a package is removed, carriers left without packages go
+    coord.tracking_numbers.remove("LP00001")
+    coord.summary.discard("LP00001")
+    platform.update()
+    removed = {c.args[0] for c in platform.registry.async_remove.call_args_list}
+    assert {"sensor.track17_test_carrier_ups", "sensor.track17_test_carrier_usps"} <= removed
+    assert "sensor.track17_test_carrier_dhl" not in removed
@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.track17.timeline import PackageTimeline
+
+
+def _payload(*events):
+    return {
+        "status": "InTransit",
+        "track_info": {
+            "tracking": {
+                "providers": [
+                    {"events": [{"time_iso": t, "description": d, "stage": s} for t, d, s in events]}
+                ]
+            }
+        },
+    }
+
+
+PICKED_UP = ("2024-01-01T08:00:00Z", "Picked up", "PickedUp")
+CUSTOMS = ("2024-01-02T09:00:00Z", "Customs clearance", None)
+OUT = ("2024-01-03T07:00:00Z", "Out for delivery", "OutForDelivery")
+
+
+def test_timeline_seeds_then_returns_only_new_events():
+    timeline = PackageTimeline()
+
+    assert timeline.merge("LP1", _payload(PICKED_UP)) == []
+    new = timeline.merge("LP1", _payload(CUSTOMS, PICKED_UP))
+    assert [e["description"] for e in new] == ["Customs clearance"]
+    assert timeline.merge("LP1", _payload(CUSTOMS, PICKED_UP)) == []
+    assert [e["description"] for e in timeline.history("LP1")] == ["Picked up", "Customs clearance"]
+
+
+def test_coordinator_fires_checkpoint_for_new_events(make_coordinator):
+    hass = MagicMock()
+    coord = make_coordinator(hass)
+    coord.tracking_numbers = ["LP1"]
+
+    coord.data = coord._merge_results({"LP1": _payload(PICKED_UP)})
+    coord.data = coord._merge_results({"LP1": _payload(PICKED_UP, CUSTOMS, OUT)})
+
+    fired = [c.args for c in hass.bus.async_fire.call_args_list if c.args[0] == "track17_checkpoint"]
+    assert [args[1]["description"] for args in fired] == ["Customs clearance", "Out for delivery"]
+    assert fired[1][1]["stage"] == "OutForDelivery"
+    assert fired[1][1]["tracking_number"] == "LP1"
+
+
+def test_trimmed_events_are_not_new_again():
+    timeline = PackageTimeline()
+    events = [(f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z", f"Scan {i}", None) for i in range(120)]
+
+    timeline.merge("LP1", _payload(*events))
+    assert len(timeline.history("LP1")) == 100
+    assert timeline.merge("LP1", _payload(*events)) == []
+
+    latest = ("2024-01-02T00:00:00Z", "Delivered", "Delivered")
+    new = timeline.merge("LP1", _payload(*events, latest))
+    assert [e["description"] for e in new] == ["Delivered"]
+    assert timeline.merge("LP1", _payload(*events, latest)) == []
+
+    # Also after a restart, from the stored history
+    restored = PackageTimeline()
+    restored.load("LP1", timeline.history("LP1"))
+    assert restored.merge("LP1", _payload(*events, latest)) == []
+
+
+@pytest.mark.asyncio
+async def test_added_package_does_not_replay_history_on_first_poll(make_coordinator):
+    hass = MagicMock()
+    coord = make_coordinator(hass)
+    coord.data = {}
+    coord.api = MagicMock()
+    coord.api.async_register_batch = AsyncMock(return_value={"LP00001": {"carrier": 3011}})
+
+    assert (await coord.async_add_packages(["LP00001"]))["LP00001"]["success"]
+    coord.data = coord._merge_results({"LP00001": _payload(PICKED_UP, CUSTOMS)})
+    coord.data = coord._merge_results({"LP00001": _payload(PICKED_UP, CUSTOMS, OUT)})
+
+    fired = [c.args for c in hass.bus.async_fire.call_args_list if c.args[0] == "track17_checkpoint"]
+    assert [args[1]["description"] for args in fired] == ["Out for delivery"]
@@ -0,0 +1,104 @@
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_17track import Fake17Track, FakeConfig
+from benchmarks.replay import make_coordinator, profile_cycle
+from custom_components.track17.api import Track17Api
+from custom_components.track17.models import PackageState
+from custom_components.track17.transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+    TransportResponse,
+)
+
+
+async def _record(path: Path, numbers):
+    async with Fake17Track(FakeConfig(latency=0)) as fake:
+        api = Track17Api("secret-key", base_url=fake.base_url)
+        api.transport = RecordingTransport(AiohttpTransport(api._get_session), str(path))
+        live = await api.async_get_tracking_batch(numbers)
+        await api.async_close()
+    return live
+
+
+@pytest.mark.asyncio
+async def test_replay_returns_recorded_results(tmp_path):
+    path = tmp_path / "traffic.jsonl.gz"
+    live = await _record(path, ["LP00001", "LP00002"])
+
+    with gzip.open(path, "rt") as handle:
+        text = handle.read()
+    assert "secret-key" not in text
+    assert json.loads(text.splitlines()[1])["endpoint"] == "gettrackinfo"
+
+    api = Track17Api("replay", transport=ReplayTransport.from_file(str(path), speed=1000))
+    replayed = await api.async_get_tracking_batch(["LP00002", "LP00001", "UNKNOWN1"])
+
+    assert replayed["LP00001"] == live["LP00001"]
+    assert replayed["LP00002"] == live["LP00002"]
+    assert replayed["UNKNOWN1"]["code"] == -18019902
+
+
+@pytest.mark.asyncio
+async def test_replay_scales_out_with_synthetic_numbers(tmp_path):
+    path = tmp_path / "traffic.jsonl.gz"
+    live = await _record(path, ["LP00001", "LP00002"])
+    transport = ReplayTransport.from_file(str(path), speed=1000)
+
+    numbers = transport.numbers(5)
+    assert numbers[:2] == ["LP00001", "LP00002"] and len(set(numbers)) == 5
+
+    api = Track17Api("replay", transport=transport)
+    replayed = await api.async_get_tracking_batch(numbers)
+    assert isinstance(replayed[numbers[4]], PackageState)
+    assert replayed[numbers[4]].number == numbers[4]
+    assert replayed[numbers[4]].status == live["LP00001"].status
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_recorded_failures():
+    transport = ReplayTransport(
+        [
+            {"offset": 0.0, "latency": 0.0, "endpoint": "gettrackinfo", "request": [],
+             "status": 429, "retry_after": "0", "body": ""},
+        ]
+    )
+    response = await transport.async_post("http://x/gettrackinfo", [{"number": "LP00001"}], {}, None)
+    assert response == TransportResponse(429, {"Retry-After": "0"}, b"")
+    response = await transport.async_post("http://x/gettrackinfo", [{"number": "LP00001"}], {}, None)
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_profile_cycle_under_replay(tmp_path):
+    path = tmp_path / "traffic.jsonl.gz"
+    await _record(path, ["LP00001", "LP00002"])
+    transport = ReplayTransport.from_file(str(path), speed=1000)
+    numbers = transport.numbers(50)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            coordinator = make_coordinator(hass, Track17Api("replay", transport=transport), numbers)
+            coordinator._registered = set(numbers)
+            stats = await profile_cycle(coordinator)
+        finally:
+            await hass.async_stop(force=True)
+
+    assert set(coordinator.data) == set(numbers)
+    assert stats.total_calls > 0
+
+
+def test_transport_without_async_post_cannot_be_created():
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,76 @@
+import hashlib
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.track17.webhook import async_handle_push_request
+
+SAMPLE_PUSH = {
+    "event": "TRACKING_UPDATED",
+    "data": {
+        "number": "LP1",
+        "carrier": 3011,
+        "track_info": {
+            "latest_status": {"status": "InTransit"},
+            "latest_event": {"description": "Arrived at facility", "time_iso": "2024-01-01T10:00:00Z"},
+        },
+    },
+}
+
+
+def _sign(body: str, key: str) -> str:
+    return hashlib.sha256(f"{body}/{key}".encode()).hexdigest()
+
+
+@pytest_asyncio.fixture
+async def push_client(make_coordinator):
+    coord = make_coordinator(api_key="secret", push_mode=True)
+    coord.tracking_numbers = ["LP1"]
+    coord.data = {}
+
+    async def handle(request):
+        return await async_handle_push_request(coord, request)
+
+    app = web.Application()
+    app.router.add_post("/push", handle)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    yield coord, client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_signed_push_updates_only_that_package(push_client):
+    coord, client = push_client
+    body = json.dumps(SAMPLE_PUSH)
+
+    resp = await client.post("/push", data=body, headers={"sign": _sign(body, "secret")})
+
+    assert resp.status == 200
+    assert coord.data["LP1"]["status"] == "InTransit"
+    assert coord.data["LP1"]["lastEvent"] == "Arrived at facility"
+    assert coord.changed_numbers == {"LP1"}
+
+
+@pytest.mark.asyncio
+async def test_push_with_bad_signature_is_rejected(push_client):
+    coord, client = push_client
+    body = json.dumps(SAMPLE_PUSH)
+
+    resp = await client.post("/push", data=body, headers={"sign": _sign(body, "wrong")})
+
+    assert resp.status == 401
+    assert coord.data == {}
+
+
+@pytest.mark.asyncio
+async def test_signed_push_that_is_not_an_object_is_rejected(push_client):
+    coord, client = push_client
+
+    for body in ("[1, 2]", "not json"):
+        resp = await client.post("/push", data=body, headers={"sign": _sign(body, "secret")})
+        assert resp.status == 400
+    assert coord.data == {}